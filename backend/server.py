@@ -1,37 +1,69 @@
 from fastapi import FastAPI, HTTPException, Depends, Header, BackgroundTasks, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+from pydantic import AfterValidator, BaseModel, Field
+from typing import Annotated, List, Optional
 from datetime import datetime, date, timedelta
 from bson import ObjectId
-from pymongo import MongoClient
+from pymongo import MongoClient, ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from motor.motor_asyncio import AsyncIOMotorClient
+import asyncio
+import bcrypt
+import concurrent.futures
+import hashlib
+import multiprocessing
 import os
-import base64
 import io
 import jwt
 import secrets
 import httpx
 import resend
-from PIL import Image
-from passlib.context import CryptContext
+from PIL import Image, ImageFile
+
+# Encode large JPEGs in one block instead of the default 64 KB chunks
+ImageFile.MAXBLOCK = max(ImageFile.MAXBLOCK, 4 * 1024 * 1024)
+from reportlab.lib import colors as rl_colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.lib.enums import TA_CENTER
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, Image as RLImage
+from cachetools import LRUCache, TTLCache
+import orjson
+import pybase64
 from dotenv import load_dotenv
 from google.oauth2 import id_token
 from google.auth.transport import requests as google_requests
 
 load_dotenv()
 
-app = FastAPI(title="Blueview API", description="Site Operations Hub - Production")
+# orjson serializes responses in native code (datetime/UUID included) -
+# meaningful on the list endpoints and the multi-MB base64 PDF payloads
+app = FastAPI(
+    title="Blueview API",
+    description="Site Operations Hub - Production",
+    default_response_class=ORJSONResponse,
+)
+
+# Comma-separated allow-list; wildcard fallback keeps local/dev setups working
+CORS_ALLOW_ORIGINS = [o.strip() for o in os.getenv("CORS_ALLOW_ORIGINS", "*").split(",") if o.strip()]
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=CORS_ALLOW_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=86400,
 )
 
+# Daily-log JSON embeds base64 photos that gzip extremely well; level 4 keeps
+# CPU cost low and small responses skip compression entirely
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=4)
+
 # ============== CONFIGURATION ==============
 MONGO_URL = os.getenv("MONGO_URL")
 DB_NAME = os.getenv("DB_NAME", "blueview")
@@ -50,14 +82,38 @@ RESEND_API_KEY = os.getenv("RESEND_API_KEY")
 if RESEND_API_KEY:
     resend.api_key = RESEND_API_KEY
 
+# "inline" posts the report PDFs as base64 attachments through Resend's JSON
+# API (inflates a 3 MB report to ~5-6 MB of HTTP body); "links" sends download
+# links to the stored reports instead, keeping the email request tiny
+REPORT_EMAIL_ATTACHMENTS = os.getenv("REPORT_EMAIL_ATTACHMENTS", "inline")
+
 # Dropbox OAuth
 DROPBOX_APP_KEY = os.getenv("DROPBOX_APP_KEY")
 DROPBOX_APP_SECRET = os.getenv("DROPBOX_APP_SECRET")
 
-# MongoDB connection
-client = MongoClient(MONGO_URL)
+# MongoDB connection. Sized for a few uvicorn workers with async parallelism
+# inside each: 50 pooled connections per process is plenty, minPoolSize keeps
+# a handful warm so login bursts don't pay TCP+TLS+auth setup (50-500ms per
+# connection), and maxConnecting bounds a connection stampede. zstd wire
+# compression is negotiated only when server and client both support it
+# (only zstandard ships in requirements, so snappy isn't offered).
+_MONGO_OPTIONS = dict(
+    maxPoolSize=50,
+    minPoolSize=5,
+    maxConnecting=4,
+    maxIdleTimeMS=60000,
+    serverSelectionTimeoutMS=3000,
+    compressors="zstd",
+)
+client = MongoClient(MONGO_URL, **_MONGO_OPTIONS)
 db = client[DB_NAME]
 
+# Async MongoDB connection (motor) - awaited from async endpoints so DB
+# round-trips don't block the event loop. The sync collections below stay
+# for code that runs outside the event loop (PDF helpers, background tasks).
+async_client = AsyncIOMotorClient(MONGO_URL, **_MONGO_OPTIONS)
+async_db = async_client[DB_NAME]
+
 # Collections
 users_collection = db["users"]
 workers_collection = db["workers"]
@@ -86,26 +142,98 @@ TWILIO_PHONE_NUMBER = os.getenv("TWILIO_PHONE_NUMBER")
 RADAR_API_KEY = os.getenv("RADAR_API_KEY")
 RADAR_SECRET_KEY = os.getenv("RADAR_SECRET_KEY")
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing. 10 bcrypt rounds (~4x faster than the default 12, still
+# a strong work factor); verification runs in a bounded pool so a login burst
+# neither blocks the event loop nor spawns unbounded threads.
+BCRYPT_ROUNDS = 10
+BCRYPT_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 4)
+)
 security = HTTPBearer()
 
+# ReportLab rendering is CPU-bound and holds the GIL, so threads don't help;
+# a process pool lets concurrent report requests render on separate cores.
+# "spawn" keeps children from inheriting the MongoClient, which is not
+# fork-safe - each child builds its own connection on first use.
+PDF_POOL = concurrent.futures.ProcessPoolExecutor(
+    max_workers=os.cpu_count(),
+    mp_context=multiprocessing.get_context("spawn"),
+)
+
 # ============== HELPERS ==============
 
-def serialize_doc(doc):
+def serialize_doc(doc, _str=str):
     if doc is None:
         return None
-    doc["id"] = str(doc.pop("_id"))
+    doc["id"] = _str(doc.pop("_id"))
     return doc
 
-def serialize_docs(docs):
-    return [serialize_doc(doc) for doc in docs]
+def serialize_docs(docs, _str=str):
+    # Inlined rather than delegating to serialize_doc: cursors never yield
+    # None, and skipping a Python call per document matters on large result
+    # sets. A generator would be nicer but the response model machinery
+    # expects a list.
+    for doc in docs:
+        doc["id"] = _str(doc.pop("_id"))
+    return docs
+
+def assigned_project_ids(user):
+    """assigned_projects as strings for API responses (stored as ObjectIds)"""
+    return [str(p) for p in user.get("assigned_projects", [])]
+
+def to_object_ids(ids):
+    return [ObjectId(p) for p in ids if ObjectId.is_valid(p)]
+
+def _require_object_id(value: str) -> str:
+    if not ObjectId.is_valid(value):
+        raise ValueError("value is not a valid ObjectId")
+    return value
+
+# Path-parameter type: malformed ids fail validation as a 422 before the
+# handler runs, so handlers can call ObjectId() without try/except
+PyObjectId = Annotated[str, AfterValidator(_require_object_id)]
+
+def _utc_day_start():
+    """Start of the current UTC day. Check-ins store datetime.utcnow(), so
+    day filters must not be built from server-local date.today()."""
+    return datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+
+# daily_logs store log_date as a midnight BSON datetime: 8-byte index keys,
+# server-side range queries and a real (not lexicographic) sort. The API
+# keeps speaking YYYY-MM-DD strings at the edges.
+def _parse_log_date(value: str) -> datetime:
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise HTTPException(status_code=422, detail="log_date must be an ISO date (YYYY-MM-DD)")
+
+def _format_log_date(log):
+    """Convert a stored log_date back to the string the API has always
+    returned; tolerates legacy string values from before the migration."""
+    value = log.get("log_date")
+    if isinstance(value, datetime):
+        log["log_date"] = value.strftime("%Y-%m-%d")
+    return log
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    # Direct bcrypt keeps the $2b$ format passlib produced without its
+    # per-call scheme dispatch
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    # Direct checkpw skips passlib's scheme dispatch on the hot login path
+    return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+
+async def hash_password_async(password: str) -> str:
+    """hash_password for async handlers: a bcrypt round is 60-100 ms of CPU,
+    far too long to hold the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(
+        BCRYPT_POOL, hash_password, password
+    )
+
+# Verified against unknown emails so the negative login path costs a full
+# bcrypt round, same as the positive path (no enumeration timing signal)
+DUMMY_HASH = hash_password("not-a-real-password")
 
 def create_access_token(user_id: str, role: str, email: str) -> str:
     payload = {
@@ -125,13 +253,31 @@ def decode_token(token: str) -> dict:
     except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
 
+# Auth cache: blake2b(token) -> serialized user. Every route depends on
+# get_current_user, so repeat requests from the same client skip both the JWT
+# decode and the users round-trip. The short TTL bounds staleness after role
+# or assignment changes; logout invalidates the entry explicitly.
+_auth_cache = TTLCache(maxsize=10000, ttl=30)
+_auth_cache_lock = asyncio.Lock()
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     token = credentials.credentials
+    cache_key = _token_cache_key(token)
+    async with _auth_cache_lock:
+        cached = _auth_cache.get(cache_key)
+    if cached is not None:
+        return dict(cached)
     payload = decode_token(token)
-    user = users_collection.find_one({"_id": ObjectId(payload["user_id"])})
+    user = await async_db.users.find_one({"_id": ObjectId(payload["user_id"])})
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
-    return serialize_doc(user)
+    user = serialize_doc(user)
+    async with _auth_cache_lock:
+        _auth_cache[cache_key] = user
+    return dict(user)
 
 async def require_admin(current_user: dict = Depends(get_current_user)):
     if current_user["role"] != "admin":
@@ -443,6 +589,96 @@ class SafetyMeetingCreate(BaseModel):
     safety_concerns: str
     attendees: List[SafetyMeetingEntry]
 
+# ============== STARTUP ==============
+
+@app.on_event("startup")
+async def ensure_indexes():
+    """Declare indexes for the hot query paths (no-op once they exist).
+
+    Performance indexes may fail on legacy data (e.g. duplicate emails)
+    without blocking boot - queries just fall back to collection scans. The
+    unique indexes flagged required=True are different: create_project's
+    QR-collision retry and create_daily_log's duplicate rejection depend on
+    them, so a build failure there aborts startup instead of silently
+    turning the 400-on-duplicate contract into duplicate inserts."""
+    specs = [
+        # (label, required, create_index coroutine)
+        ("users.email", False,
+         async_db.users.create_index("email", unique=True)),
+        ("projects.qr_code", True,
+         async_db.projects.create_index("qr_code", unique=True)),
+        ("checkins.project_id+check_in_time", False,
+         async_db.checkins.create_index([("project_id", 1), ("check_in_time", -1)])),
+        # Covers the active-checkin filter which also matches check_out_time None
+        ("checkins.project_id+check_in_time+check_out_time", False,
+         async_db.checkins.create_index(
+             [("project_id", 1), ("check_in_time", 1), ("check_out_time", 1)]
+         )),
+        # Duplicate-checkin guard lookup in create_checkin
+        ("checkins.worker_id+project_id+check_in_time", False,
+         async_db.checkins.create_index(
+             [("worker_id", 1), ("project_id", 1), ("check_in_time", 1)]
+         )),
+        ("checkins.project_id+worker_id+check_out_time", False,
+         async_db.checkins.create_index(
+             [("project_id", 1), ("worker_id", 1), ("check_out_time", 1)]
+         )),
+        ("daily_logs.project_id+log_date", True,
+         async_db.daily_logs.create_index(
+             [("project_id", 1), ("log_date", -1)], unique=True
+         )),
+        # Keyset pagination in get_project_reports and the cache_key
+        # probe in generate_daily_report; without these both scan a
+        # collection whose docs carry multi-MB PDF payloads
+        ("generated_reports.project_id+report_date", False,
+         async_db.generated_reports.create_index(
+             [("project_id", 1), ("report_date", -1)]
+         )),
+        ("generated_reports.cache_key", False,
+         async_db.generated_reports.create_index("cache_key")),
+        ("workers.user_id", False,
+         async_db.workers.create_index("user_id")),
+    ]
+    results = await asyncio.gather(
+        *(coro for _, _, coro in specs), return_exceptions=True
+    )
+    for (label, required, _), result in zip(specs, results):
+        if isinstance(result, Exception):
+            if required:
+                raise RuntimeError(
+                    f"required unique index {label} failed to build: {result}"
+                ) from result
+            print(f"Index {label} creation failed: {result}")
+
+@app.on_event("startup")
+async def migrate_assigned_projects():
+    """Upgrade legacy string assigned_projects entries to ObjectIds"""
+    try:
+        async for user in async_db.users.find(
+            {"assigned_projects.0": {"$type": "string"}}, {"assigned_projects": 1}
+        ):
+            await async_db.users.update_one(
+                {"_id": user["_id"]},
+                {"$set": {"assigned_projects": to_object_ids(user["assigned_projects"])}}
+            )
+    except Exception as e:
+        print(f"assigned_projects migration failed: {e}")
+
+@app.on_event("startup")
+async def migrate_log_dates():
+    """Upgrade legacy string log_date values to BSON datetimes so the
+    (project_id, log_date) index stays single-typed and sortable"""
+    try:
+        async for log in async_db.daily_logs.find(
+            {"log_date": {"$type": "string"}}, {"log_date": 1}
+        ):
+            await async_db.daily_logs.update_one(
+                {"_id": log["_id"]},
+                {"$set": {"log_date": datetime.fromisoformat(log["log_date"])}}
+            )
+    except Exception as e:
+        print(f"log_date migration failed: {e}")
+
 # ============== HEALTH CHECK ==============
 
 @app.get("/api/health")
@@ -452,13 +688,15 @@ def health_check():
 # ============== AUTH ENDPOINTS ==============
 
 @app.post("/api/auth/login")
-def login_user(credentials: UserLogin):
+async def login_user(credentials: UserLogin):
     """Login with email/password (Admin and CP)"""
-    user = users_collection.find_one({"email": credentials.email.lower()})
-    if not user:
-        raise HTTPException(status_code=401, detail="Invalid credentials")
-    
-    if not verify_password(credentials.password, user["password"]):
+    user = await async_db.users.find_one({"email": credentials.email.lower()})
+
+    hashed = user["password"] if user else DUMMY_HASH
+    verified = await asyncio.get_running_loop().run_in_executor(
+        BCRYPT_POOL, verify_password, credentials.password, hashed
+    )
+    if not user or not verified:
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
     token = create_access_token(str(user["_id"]), user["role"], user["email"])
@@ -473,12 +711,12 @@ def login_user(credentials: UserLogin):
             "role": user["role"],
             "has_passport": has_passport,
             "worker_passport_id": user.get("worker_passport_id"),
-            "assigned_projects": user.get("assigned_projects", [])
+            "assigned_projects": assigned_project_ids(user)
         }
     }
 
 @app.post("/api/auth/google")
-def google_auth(data: GoogleAuthRequest):
+async def google_auth(data: GoogleAuthRequest):
     """Google OAuth login - auto-assigns Worker role for new users"""
     email = data.email.lower()
     
@@ -494,8 +732,8 @@ def google_auth(data: GoogleAuthRequest):
     except Exception as e:
         print(f"Google token verification skipped: {e}")
     
-    user = users_collection.find_one({"email": email})
-    
+    user = await async_db.users.find_one({"email": email})
+
     if user:
         token = create_access_token(str(user["_id"]), user["role"], email)
         has_passport = user.get("worker_passport_id") is not None
@@ -508,14 +746,17 @@ def google_auth(data: GoogleAuthRequest):
                 "role": user["role"],
                 "has_passport": has_passport,
                 "worker_passport_id": user.get("worker_passport_id"),
-                "assigned_projects": user.get("assigned_projects", [])
+                "assigned_projects": assigned_project_ids(user)
             },
             "is_new": False
         }
     else:
+        placeholder_password = await asyncio.get_running_loop().run_in_executor(
+            BCRYPT_POOL, hash_password, secrets.token_urlsafe(32)
+        )
         user_dict = {
             "email": email,
-            "password": hash_password(secrets.token_urlsafe(32)),
+            "password": placeholder_password,
             "name": data.name,
             "role": "worker",
             "photo_url": data.photo_url,
@@ -524,7 +765,7 @@ def google_auth(data: GoogleAuthRequest):
             "created_at": datetime.utcnow(),
             "worker_passport_id": None,
         }
-        result = users_collection.insert_one(user_dict)
+        result = await async_db.users.insert_one(user_dict)
         token = create_access_token(str(result.inserted_id), "worker", email)
         
         return {
@@ -541,6 +782,13 @@ def google_auth(data: GoogleAuthRequest):
             "is_new": True
         }
 
+@app.post("/api/auth/logout")
+async def logout_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    """Drop the cached auth entry for this token"""
+    async with _auth_cache_lock:
+        _auth_cache.pop(_token_cache_key(credentials.credentials), None)
+    return {"message": "Logged out"}
+
 @app.get("/api/auth/me")
 def get_me(current_user: dict = Depends(get_current_user)):
     has_passport = current_user.get("worker_passport_id") is not None
@@ -551,39 +799,39 @@ def get_me(current_user: dict = Depends(get_current_user)):
         "role": current_user["role"],
         "has_passport": has_passport,
         "worker_passport_id": current_user.get("worker_passport_id"),
-        "assigned_projects": current_user.get("assigned_projects", [])
+        "assigned_projects": assigned_project_ids(current_user)
     }
 
 # ============== ADMIN: USER MANAGEMENT ==============
 
 @app.get("/api/admin/users")
-def get_all_users(current_user: dict = Depends(require_admin)):
-    users = list(users_collection.find())
+async def get_all_users(current_user: dict = Depends(require_admin)):
+    users = await async_db.users.find(projection={"password": 0}).to_list(length=None)
     return [{
         "id": str(u["_id"]),
         "email": u["email"],
         "name": u["name"],
         "role": u["role"],
-        "assigned_projects": u.get("assigned_projects", []),
+        "assigned_projects": assigned_project_ids(u),
         "created_at": u.get("created_at")
     } for u in users]
 
 @app.post("/api/admin/create-cp")
-def create_cp(cp: CPCreate, current_user: dict = Depends(require_admin)):
-    existing = users_collection.find_one({"email": cp.email.lower()})
+async def create_cp(cp: CPCreate, current_user: dict = Depends(require_admin)):
+    existing = await async_db.users.find_one({"email": cp.email.lower()})
     if existing:
         raise HTTPException(status_code=400, detail="Email already registered")
     
     user_dict = {
         "email": cp.email.lower(),
-        "password": hash_password(cp.password),
+        "password": await hash_password_async(cp.password),
         "name": cp.name,
         "role": "cp",
-        "assigned_projects": cp.assigned_projects,
+        "assigned_projects": to_object_ids(cp.assigned_projects),
         "created_at": datetime.utcnow(),
         "created_by": current_user["id"],
     }
-    result = users_collection.insert_one(user_dict)
+    result = await async_db.users.insert_one(user_dict)
     
     return {
         "id": str(result.inserted_id),
@@ -594,44 +842,38 @@ def create_cp(cp: CPCreate, current_user: dict = Depends(require_admin)):
     }
 
 @app.put("/api/admin/users/{user_id}/assign-projects")
-def assign_projects_to_user(user_id: str, project_ids: List[str], current_user: dict = Depends(require_admin)):
-    try:
-        result = users_collection.update_one(
-            {"_id": ObjectId(user_id)},
-            {"$set": {"assigned_projects": project_ids}}
-        )
-        if result.matched_count == 0:
-            raise HTTPException(status_code=404, detail="User not found")
-        return {"message": "Projects assigned successfully"}
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+async def assign_projects_to_user(user_id: PyObjectId, project_ids: List[str], current_user: dict = Depends(require_admin)):
+    result = await async_db.users.update_one(
+        {"_id": ObjectId(user_id)},
+        {"$set": {"assigned_projects": to_object_ids(project_ids)}}
+    )
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="User not found")
+    return {"message": "Projects assigned successfully"}
 
 @app.delete("/api/admin/users/{user_id}")
-def delete_user(user_id: str, current_user: dict = Depends(require_admin)):
-    try:
-        result = users_collection.delete_one({"_id": ObjectId(user_id)})
-        if result.deleted_count == 0:
-            raise HTTPException(status_code=404, detail="User not found")
-        return {"message": "User deleted successfully"}
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+async def delete_user(user_id: PyObjectId, current_user: dict = Depends(require_admin)):
+    result = await async_db.users.delete_one({"_id": ObjectId(user_id)})
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="User not found")
+    return {"message": "User deleted successfully"}
 
 # ============== WORKER PASSPORT ==============
 
 @app.post("/api/workers")
-def create_worker_passport(worker: WorkerPassportCreate, current_user: dict = Depends(get_current_user)):
+async def create_worker_passport(worker: WorkerPassportCreate, current_user: dict = Depends(get_current_user)):
     worker_dict = worker.model_dump()
     worker_dict["created_at"] = datetime.utcnow()
     worker_dict["updated_at"] = datetime.utcnow()
     worker_dict["user_id"] = current_user["id"] if current_user["role"] == "worker" else None
     
-    result = workers_collection.insert_one(worker_dict)
+    result = await async_db.workers.insert_one(worker_dict)
     worker_dict["id"] = str(result.inserted_id)
     if "_id" in worker_dict:
         del worker_dict["_id"]
     
     if current_user["role"] == "worker":
-        users_collection.update_one(
+        await async_db.users.update_one(
             {"_id": ObjectId(current_user["id"])},
             {"$set": {"worker_passport_id": str(result.inserted_id)}}
         )
@@ -639,115 +881,109 @@ def create_worker_passport(worker: WorkerPassportCreate, current_user: dict = De
     return worker_dict
 
 @app.get("/api/workers")
-def get_workers(current_user: dict = Depends(get_current_user)):
-    workers = list(workers_collection.find())
+async def get_workers(current_user: dict = Depends(get_current_user)):
+    workers = await async_db.workers.find().to_list(length=None)
     return serialize_docs(workers)
 
 @app.get("/api/workers/{worker_id}")
-def get_worker(worker_id: str):
-    try:
-        worker = workers_collection.find_one({"_id": ObjectId(worker_id)})
-        if not worker:
-            raise HTTPException(status_code=404, detail="Worker not found")
-        return serialize_doc(worker)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+async def get_worker(worker_id: PyObjectId):
+    worker = await async_db.workers.find_one({"_id": ObjectId(worker_id)})
+    if not worker:
+        raise HTTPException(status_code=404, detail="Worker not found")
+    return serialize_doc(worker)
 
 @app.put("/api/workers/{worker_id}")
-def update_worker(worker_id: str, worker: WorkerPassportUpdate, current_user: dict = Depends(get_current_user)):
-    try:
-        update_data = {k: v for k, v in worker.model_dump().items() if v is not None}
-        update_data["updated_at"] = datetime.utcnow()
-        result = workers_collection.update_one(
-            {"_id": ObjectId(worker_id)},
-            {"$set": update_data}
-        )
-        if result.matched_count == 0:
-            raise HTTPException(status_code=404, detail="Worker not found")
-        return get_worker(worker_id)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+async def update_worker(worker_id: PyObjectId, worker: WorkerPassportUpdate, current_user: dict = Depends(get_current_user)):
+    update_data = worker.model_dump(exclude_none=True)
+    update_data["updated_at"] = datetime.utcnow()
+    # find_one_and_update returns the new doc in the same server op, so the
+    # update endpoints don't pay a second round trip to echo the result
+    worker_doc = await async_db.workers.find_one_and_update(
+        {"_id": ObjectId(worker_id)},
+        {"$set": update_data},
+        return_document=ReturnDocument.AFTER
+    )
+    if worker_doc is None:
+        raise HTTPException(status_code=404, detail="Worker not found")
+    return serialize_doc(worker_doc)
 
 @app.delete("/api/workers/{worker_id}")
-def delete_worker(worker_id: str, current_user: dict = Depends(require_cp_or_admin)):
-    try:
-        result = workers_collection.delete_one({"_id": ObjectId(worker_id)})
-        if result.deleted_count == 0:
-            raise HTTPException(status_code=404, detail="Worker not found")
-        return {"message": "Worker deleted successfully"}
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+async def delete_worker(worker_id: PyObjectId, current_user: dict = Depends(require_cp_or_admin)):
+    result = await async_db.workers.delete_one({"_id": ObjectId(worker_id)})
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Worker not found")
+    return {"message": "Worker deleted successfully"}
 
 # ============== PROJECTS ==============
 
 @app.post("/api/projects")
-def create_project(project: ProjectCreate, current_user: dict = Depends(require_admin)):
-    import uuid
+async def create_project(project: ProjectCreate, current_user: dict = Depends(require_admin)):
     project_dict = project.model_dump()
-    project_dict["qr_code"] = str(uuid.uuid4())[:8].upper()
     project_dict["created_at"] = datetime.utcnow()
     project_dict["updated_at"] = datetime.utcnow()
     project_dict["created_by"] = current_user["id"]
     project_dict["dropbox_folder"] = None
     project_dict["dropbox_token"] = None
-    result = projects_collection.insert_one(project_dict)
+    # token_hex gives the same 8-char uppercase code a sliced uuid4 did,
+    # without the UUID construction; the unique qr_code index turns the
+    # (1-in-4-billion) collision into a retry instead of a silent duplicate
+    while True:
+        project_dict["qr_code"] = secrets.token_hex(4).upper()
+        try:
+            result = await async_db.projects.insert_one(project_dict)
+            break
+        except DuplicateKeyError:
+            project_dict.pop("_id", None)
     project_dict["id"] = str(result.inserted_id)
     if "_id" in project_dict:
         del project_dict["_id"]
     return project_dict
 
 @app.get("/api/projects")
-def get_projects(current_user: dict = Depends(get_current_user)):
+async def get_projects(current_user: dict = Depends(get_current_user)):
     if current_user["role"] == "cp":
+        # assigned_projects are stored as ObjectIds, so the list feeds the
+        # _id index directly with no per-request parsing
         assigned_ids = current_user.get("assigned_projects", [])
         if not assigned_ids:
             return []
-        object_ids = [ObjectId(pid) for pid in assigned_ids if ObjectId.is_valid(pid)]
-        projects = list(projects_collection.find({"_id": {"$in": object_ids}}))
+        projects = await async_db.projects.find({"_id": {"$in": assigned_ids}}).to_list(length=None)
     else:
-        projects = list(projects_collection.find())
+        projects = await async_db.projects.find().to_list(length=None)
     return serialize_docs(projects)
 
 @app.get("/api/projects/{project_id}")
-def get_project(project_id: str, current_user: dict = Depends(get_current_user)):
-    try:
-        if current_user["role"] == "cp":
-            if project_id not in current_user.get("assigned_projects", []):
-                raise HTTPException(status_code=403, detail="Access denied to this project")
-        
-        project = projects_collection.find_one({"_id": ObjectId(project_id)})
-        if not project:
-            raise HTTPException(status_code=404, detail="Project not found")
-        return serialize_doc(project)
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+async def get_project(project_id: PyObjectId, current_user: dict = Depends(get_current_user)):
+    if current_user["role"] == "cp":
+        if ObjectId(project_id) not in current_user.get("assigned_projects", []):
+            raise HTTPException(status_code=403, detail="Access denied to this project")
+
+    project = await async_db.projects.find_one({"_id": ObjectId(project_id)})
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    return serialize_doc(project)
 
 @app.put("/api/projects/{project_id}")
-def update_project(project_id: str, project: ProjectUpdate, current_user: dict = Depends(require_admin)):
-    try:
-        update_data = {k: v for k, v in project.model_dump().items() if v is not None}
-        update_data["updated_at"] = datetime.utcnow()
-        result = projects_collection.update_one(
-            {"_id": ObjectId(project_id)},
-            {"$set": update_data}
-        )
-        if result.matched_count == 0:
-            raise HTTPException(status_code=404, detail="Project not found")
-        return get_project(project_id, current_user)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+async def update_project(project_id: PyObjectId, project: ProjectUpdate, current_user: dict = Depends(require_admin)):
+    update_data = project.model_dump(exclude_none=True)
+    update_data["updated_at"] = datetime.utcnow()
+    project_doc = await async_db.projects.find_one_and_update(
+        {"_id": ObjectId(project_id)},
+        {"$set": update_data},
+        return_document=ReturnDocument.AFTER
+    )
+    if project_doc is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    _project_cache.pop(project_id, None)
+    return serialize_doc(project_doc)
 
 @app.delete("/api/projects/{project_id}")
-def delete_project(project_id: str, current_user: dict = Depends(require_admin)):
-    try:
-        result = projects_collection.delete_one({"_id": ObjectId(project_id)})
-        if result.deleted_count == 0:
-            raise HTTPException(status_code=404, detail="Project not found")
-        return {"message": "Project deleted successfully"}
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+async def delete_project(project_id: PyObjectId, current_user: dict = Depends(require_admin)):
+    result = await async_db.projects.delete_one({"_id": ObjectId(project_id)})
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Project not found")
+    _project_cache.pop(project_id, None)
+    return {"message": "Project deleted successfully"}
 
 # ============== WEATHER API ==============
 
@@ -820,26 +1056,43 @@ async def get_weather_by_location(location: str = Query(...)):
 
 # ============== CHECK-INS ==============
 
+# Projects change rarely but get read on every QR-code scan; a short TTL
+# keeps check-ins at two Mongo round trips instead of three
+_project_cache = TTLCache(maxsize=1024, ttl=60)
+
+async def _get_project_cached(project_id: str):
+    project = _project_cache.get(project_id)
+    if project is None:
+        project = await async_db.projects.find_one({"_id": ObjectId(project_id)})
+        if project is not None:
+            _project_cache[project_id] = project
+    return project
+
 @app.post("/api/checkins")
-def create_checkin(checkin: CheckInCreate, current_user: dict = Depends(get_current_user)):
-    try:
-        worker = workers_collection.find_one({"_id": ObjectId(checkin.worker_id)})
-        project = projects_collection.find_one({"_id": ObjectId(checkin.project_id)})
-        if not worker:
-            raise HTTPException(status_code=404, detail="Worker not found")
-        if not project:
-            raise HTTPException(status_code=404, detail="Project not found")
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    
-    today_start = datetime.combine(date.today(), datetime.min.time())
-    existing = checkins_collection.find_one({
-        "worker_id": checkin.worker_id,
-        "project_id": checkin.project_id,
-        "check_in_time": {"$gte": today_start},
-        "check_out_time": None
-    })
-    
+async def create_checkin(checkin: CheckInCreate, current_user: dict = Depends(get_current_user)):
+    if not ObjectId.is_valid(checkin.worker_id) or not ObjectId.is_valid(checkin.project_id):
+        raise HTTPException(status_code=400, detail="Invalid worker or project ID")
+
+    # One concurrent round-trip window for all three pre-insert reads instead
+    # of paying Mongo RTT for each in sequence; the project doc usually comes
+    # straight from the short-lived cache since projects change rarely and
+    # only the name is copied onto the check-in. Worker docs stay uncached
+    # because their signature/photo fields are snapshotted into the record.
+    today_start = _utc_day_start()
+    worker, project, existing = await asyncio.gather(
+        async_db.workers.find_one({"_id": ObjectId(checkin.worker_id)}),
+        _get_project_cached(checkin.project_id),
+        async_db.checkins.find_one({
+            "worker_id": checkin.worker_id,
+            "project_id": checkin.project_id,
+            "check_in_time": {"$gte": today_start},
+            "check_out_time": None
+        })
+    )
+    if not worker:
+        raise HTTPException(status_code=404, detail="Worker not found")
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
     if existing:
         raise HTTPException(status_code=400, detail="Worker already checked in today")
     
@@ -859,50 +1112,58 @@ def create_checkin(checkin: CheckInCreate, current_user: dict = Depends(get_curr
         "checked_in_by": current_user["id"],
         "signed_documents": ["daily_log", "pre_shift_meeting"]
     }
-    result = checkins_collection.insert_one(checkin_dict)
+    result = await async_db.checkins.insert_one(checkin_dict)
     checkin_dict["id"] = str(result.inserted_id)
     if "_id" in checkin_dict:
         del checkin_dict["_id"]
     return checkin_dict
 
 @app.post("/api/checkins/{checkin_id}/checkout")
-def checkout(checkin_id: str, current_user: dict = Depends(get_current_user)):
-    try:
-        result = checkins_collection.update_one(
-            {"_id": ObjectId(checkin_id)},
-            {"$set": {"check_out_time": datetime.utcnow()}}
-        )
-        if result.matched_count == 0:
-            raise HTTPException(status_code=404, detail="Check-in not found")
-        checkin = checkins_collection.find_one({"_id": ObjectId(checkin_id)})
-        return serialize_doc(checkin)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+async def checkout(checkin_id: PyObjectId, current_user: dict = Depends(get_current_user)):
+    checkin = await async_db.checkins.find_one_and_update(
+        {"_id": ObjectId(checkin_id)},
+        {"$set": {"check_out_time": datetime.utcnow()}},
+        return_document=ReturnDocument.AFTER
+    )
+    if checkin is None:
+        raise HTTPException(status_code=404, detail="Check-in not found")
+    return serialize_doc(checkin)
 
 @app.get("/api/checkins/project/{project_id}/today")
-def get_today_checkins(project_id: str, current_user: dict = Depends(get_current_user)):
-    today_start = datetime.combine(date.today(), datetime.min.time())
-    checkins = list(checkins_collection.find({
+async def get_today_checkins(project_id: str, current_user: dict = Depends(get_current_user)):
+    today_start = _utc_day_start()
+    checkins = await async_db.checkins.find({
         "project_id": project_id,
         "check_in_time": {"$gte": today_start}
-    }))
+    }).to_list(length=None)
     return serialize_docs(checkins)
 
 @app.get("/api/checkins/project/{project_id}/active")
-def get_active_checkins(project_id: str, current_user: dict = Depends(get_current_user)):
-    today_start = datetime.combine(date.today(), datetime.min.time())
-    checkins = list(checkins_collection.find({
+async def get_active_checkins(project_id: str, current_user: dict = Depends(get_current_user)):
+    today_start = _utc_day_start()
+    checkins = await async_db.checkins.find({
         "project_id": project_id,
         "check_in_time": {"$gte": today_start},
         "check_out_time": None
-    }))
+    }).to_list(length=None)
     return serialize_docs(checkins)
 
 @app.get("/api/checkins/stats/{project_id}")
-def get_checkin_stats(project_id: str, current_user: dict = Depends(get_current_user)):
-    today_start = datetime.combine(date.today(), datetime.min.time())
+async def get_checkin_stats(project_id: str, current_user: dict = Depends(get_current_user)):
+    today_start = _utc_day_start()
     pipeline = [
         {"$match": {"project_id": project_id, "check_in_time": {"$gte": today_start}}},
+        # Shrink documents before $group so the grouped worker lists only
+        # carry the fields the response needs
+        {"$project": {
+            "_id": 0,
+            "worker_company": 1,
+            "worker_name": 1,
+            "worker_trade": 1,
+            "worker_signature": 1,
+            "worker_osha": 1,
+            "worker_id_photo": 1
+        }},
         {"$group": {
             "_id": "$worker_company",
             "count": {"$sum": 1},
@@ -913,143 +1174,221 @@ def get_checkin_stats(project_id: str, current_user: dict = Depends(get_current_
                 "osha": "$worker_osha",
                 "id_photo": "$worker_id_photo"
             }}
+        }},
+        # Rename fields server-side so the result rows go to the response
+        # as-is, with no per-row rebuild in Python
+        {"$project": {
+            "_id": 0,
+            "company": "$_id",
+            "worker_count": "$count",
+            "workers": 1
         }}
     ]
-    stats = list(checkins_collection.aggregate(pipeline))
-    return [{"company": s["_id"], "worker_count": s["count"], "workers": s["workers"]} for s in stats]
+    cursor = async_db.checkins.aggregate(pipeline, allowDiskUse=True, batchSize=200)
+    return await cursor.to_list(length=None)
 
 # ============== DAILY LOGS ==============
 
 @app.post("/api/daily-logs")
-def create_daily_log(daily_log: DailyLogCreate, current_user: dict = Depends(require_cp_or_admin)):
-    existing = daily_logs_collection.find_one({
-        "project_id": daily_log.project_id,
-        "log_date": daily_log.log_date
-    })
-    if existing:
-        raise HTTPException(status_code=400, detail="Daily log already exists for this date")
-    
+async def create_daily_log(daily_log: DailyLogCreate, current_user: dict = Depends(require_cp_or_admin)):
     log_dict = daily_log.model_dump()
+    log_dict["log_date"] = _parse_log_date(daily_log.log_date)
     log_dict["created_at"] = datetime.utcnow()
     log_dict["updated_at"] = datetime.utcnow()
     log_dict["status"] = "draft"
     log_dict["created_by"] = current_user["id"]
-    result = daily_logs_collection.insert_one(log_dict)
+    try:
+        # The unique (project_id, log_date) index makes this race-free;
+        # no separate existence check round trip
+        result = await async_db.daily_logs.insert_one(log_dict)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Daily log already exists for this date")
     log_dict["id"] = str(result.inserted_id)
     if "_id" in log_dict:
         del log_dict["_id"]
-    return log_dict
+    return _format_log_date(log_dict)
 
 @app.get("/api/daily-logs/project/{project_id}")
-def get_project_daily_logs(project_id: str, current_user: dict = Depends(get_current_user)):
-    logs = list(daily_logs_collection.find({"project_id": project_id}).sort("log_date", -1))
+async def get_project_daily_logs(project_id: str, current_user: dict = Depends(get_current_user)):
+    """List daily logs for a project.
+
+    Photo payloads are excluded server-side - they can be megabytes per log
+    and the list view never renders them; fetch a single log for the images.
+    """
+    logs = await async_db.daily_logs.find(
+            {"project_id": project_id},
+            projection={"subcontractor_cards.photos.image": 0}
+        ).sort("log_date", -1).batch_size(50).to_list(length=None)
+    for log in logs:
+        _format_log_date(log)
     return serialize_docs(logs)
 
 @app.get("/api/daily-logs/{log_id}")
-def get_daily_log(log_id: str, current_user: dict = Depends(get_current_user)):
-    try:
-        log = daily_logs_collection.find_one({"_id": ObjectId(log_id)})
-        if not log:
-            raise HTTPException(status_code=404, detail="Daily log not found")
-        return serialize_doc(log)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+async def get_daily_log(log_id: PyObjectId, current_user: dict = Depends(get_current_user)):
+    log = await async_db.daily_logs.find_one({"_id": ObjectId(log_id)})
+    if not log:
+        raise HTTPException(status_code=404, detail="Daily log not found")
+    return serialize_doc(_format_log_date(log))
 
 @app.get("/api/daily-logs/project/{project_id}/date/{log_date}")
-def get_daily_log_by_date(project_id: str, log_date: str, current_user: dict = Depends(get_current_user)):
-    log = daily_logs_collection.find_one({"project_id": project_id, "log_date": log_date})
+async def get_daily_log_by_date(project_id: str, log_date: str, current_user: dict = Depends(get_current_user)):
+    log = await async_db.daily_logs.find_one({"project_id": project_id, "log_date": _parse_log_date(log_date)})
     if not log:
         return None
-    return serialize_doc(log)
+    return serialize_doc(_format_log_date(log))
 
 @app.put("/api/daily-logs/{log_id}")
-def update_daily_log(log_id: str, daily_log: DailyLogUpdate, current_user: dict = Depends(require_cp_or_admin)):
-    try:
-        update_data = {k: v for k, v in daily_log.model_dump().items() if v is not None}
-        update_data["updated_at"] = datetime.utcnow()
-        
-        if "subcontractor_cards" in update_data:
-            update_data["subcontractor_cards"] = [
-                card.model_dump() if hasattr(card, 'model_dump') else card 
-                for card in update_data["subcontractor_cards"]
-            ]
-        if "conditional_checklists" in update_data and update_data["conditional_checklists"]:
-            if hasattr(update_data["conditional_checklists"], 'model_dump'):
-                update_data["conditional_checklists"] = update_data["conditional_checklists"].model_dump()
-        
-        result = daily_logs_collection.update_one(
-            {"_id": ObjectId(log_id)},
-            {"$set": update_data}
-        )
-        if result.matched_count == 0:
-            raise HTTPException(status_code=404, detail="Daily log not found")
-        return get_daily_log(log_id, current_user)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+async def update_daily_log(log_id: PyObjectId, daily_log: DailyLogUpdate, current_user: dict = Depends(require_cp_or_admin)):
+    # model_dump recurses into nested models, so subcontractor_cards and
+    # conditional_checklists come out as plain dicts already
+    update_data = daily_log.model_dump(exclude_none=True)
+    update_data["updated_at"] = datetime.utcnow()
+
+    log = await async_db.daily_logs.find_one_and_update(
+        {"_id": ObjectId(log_id)},
+        {"$set": update_data},
+        return_document=ReturnDocument.AFTER
+    )
+    if log is None:
+        raise HTTPException(status_code=404, detail="Daily log not found")
+    _daily_log_pdf_cache.pop(log_id, None)
+    return serialize_doc(_format_log_date(log))
 
 @app.post("/api/daily-logs/{log_id}/submit")
-def submit_daily_log(log_id: str, background_tasks: BackgroundTasks, current_user: dict = Depends(require_cp_or_admin)):
+async def submit_daily_log(log_id: PyObjectId, background_tasks: BackgroundTasks, current_user: dict = Depends(require_cp_or_admin)):
+    log = await async_db.daily_logs.find_one_and_update(
+        {"_id": ObjectId(log_id)},
+        {"$set": {"status": "submitted", "submitted_at": datetime.utcnow(), "submitted_by": current_user["id"]}},
+        return_document=ReturnDocument.AFTER
+    )
+    if log is None:
+        raise HTTPException(status_code=404, detail="Daily log not found")
+    _daily_log_pdf_cache.pop(log_id, None)
+
+    # Schedule email in background
+    background_tasks.add_task(send_daily_report_email, log_id)
+
+    return serialize_doc(_format_log_date(log))
+
+# ============== IMAGE HANDLING ==============
+
+class ImageCompressRequest(BaseModel):
+    """Request to downscale a photo before it is stored on a card"""
+    image_base64: str  # base64 encoded image, with or without data-URI prefix
+
+_THUMBNAIL_MAX_SIZE = (1200, 1200)
+# BICUBIC is visually indistinguishable from LANCZOS after quality-70 JPEG
+# quantization and noticeably cheaper; set PIL_RESAMPLE=LANCZOS for archival
+# quality
+RESAMPLE_FILTER = getattr(Image.Resampling, os.getenv("PIL_RESAMPLE", "BICUBIC").upper(), Image.Resampling.BICUBIC)
+# Re-uploads of the same photo (retried submits, duplicated cards) skip the
+# decode/resize entirely; keys are blake2b digests of the incoming payload
+_thumbnail_cache = LRUCache(maxsize=256)
+
+def _compress_sync(image_base64):
+    """CPU half of compress_image; pure function so it can run in PDF_POOL
+    worker processes."""
+    # partition instead of split: no list allocation, one scan for the
+    # data-URI comma
+    header, sep, payload = image_base64.partition(",")
+    if not sep:
+        payload = header
+    raw = pybase64.b64decode(payload, validate=False)
+
+    buffer = io.BytesIO()
+    with Image.open(io.BytesIO(raw)) as image:
+        # For JPEGs, draft lets libjpeg DCT-scale during decode so far
+        # fewer pixels reach the resample kernel; no-op for other formats
+        try:
+            image.draft("RGB", _THUMBNAIL_MAX_SIZE)
+        except Exception:
+            pass
+        image.thumbnail(_THUMBNAIL_MAX_SIZE, RESAMPLE_FILTER)
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        image.save(buffer, format="JPEG", quality=70)
+    # getbuffer hands the encoder a view of the BytesIO internals rather
+    # than a full bytes copy
+    return "data:image/jpeg;base64," + pybase64.b64encode_as_string(buffer.getbuffer())
+
+@app.post("/api/images/compress")
+async def compress_image(request: ImageCompressRequest, current_user: dict = Depends(get_current_user)):
+    """Downscale and re-encode a base64 photo to bound stored document size"""
+    image_base64 = request.image_base64
+    cache_key = hashlib.blake2b(image_base64.encode(), digest_size=16).digest()
+    cached = _thumbnail_cache.get(cache_key)
+    if cached is not None:
+        return {"image_base64": cached}
+
     try:
-        result = daily_logs_collection.update_one(
-            {"_id": ObjectId(log_id)},
-            {"$set": {"status": "submitted", "submitted_at": datetime.utcnow(), "submitted_by": current_user["id"]}}
+        compressed = await asyncio.get_running_loop().run_in_executor(
+            PDF_POOL, _compress_sync, image_base64
         )
-        if result.matched_count == 0:
-            raise HTTPException(status_code=404, detail="Daily log not found")
-        
-        # Schedule email in background
-        background_tasks.add_task(send_daily_report_email, log_id)
-        
-        return get_daily_log(log_id, current_user)
     except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=400, detail=f"Image compression failed: {str(e)}")
+
+    _thumbnail_cache[cache_key] = compressed
+    return {"image_base64": compressed}
 
 # ============== PDF GENERATION ==============
 
-@app.get("/api/daily-logs/{log_id}/pdf")
-def generate_daily_log_pdf(log_id: str, current_user: dict = Depends(get_current_user)):
-    from reportlab.lib.pagesizes import letter
-    from reportlab.lib import colors
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image as RLImage
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    
-    try:
-        log = daily_logs_collection.find_one({"_id": ObjectId(log_id)})
-        if not log:
-            raise HTTPException(status_code=404, detail="Daily log not found")
-        
-        project = projects_collection.find_one({"_id": ObjectId(log["project_id"])})
-        if not project:
-            raise HTTPException(status_code=404, detail="Project not found")
-        
-        log_date = datetime.strptime(log["log_date"], "%Y-%m-%d")
-        day_start = datetime.combine(log_date.date(), datetime.min.time())
-        day_end = day_start + timedelta(days=1)
-        
-        checkins = list(checkins_collection.find({
-            "project_id": log["project_id"],
-            "check_in_time": {"$gte": day_start, "$lt": day_end}
-        }))
-        
-        buffer = io.BytesIO()
+# Styles and table layouts are immutable at render time, so build them once at
+# import instead of per request
+_PDF_STYLES = getSampleStyleSheet()
+_DL_NORMAL_STYLE = _PDF_STYLES['Normal']
+_DL_TITLE_STYLE = ParagraphStyle('DLTitle', parent=_PDF_STYLES['Heading1'], fontSize=24, spaceAfter=20, textColor=rl_colors.HexColor('#FF6B00'))
+_DL_HEADING_STYLE = ParagraphStyle('DLHeading', parent=_PDF_STYLES['Heading2'], fontSize=14, spaceAfter=10, textColor=rl_colors.HexColor('#132F4C'))
+_DL_FOOTER_STYLE = ParagraphStyle('DLFooter', parent=_PDF_STYLES['Normal'], fontSize=8, textColor=rl_colors.gray)
+_SAMPLE_TITLE_STYLE = ParagraphStyle('SampleTitle', parent=_PDF_STYLES['Heading1'], fontSize=28, spaceAfter=5, textColor=rl_colors.HexColor('#FF6B00'), alignment=TA_CENTER)
+_SAMPLE_SUBTITLE_STYLE = ParagraphStyle('SampleSubtitle', parent=_PDF_STYLES['Normal'], fontSize=12, textColor=rl_colors.HexColor('#666666'), alignment=TA_CENTER, spaceAfter=20)
+_SAMPLE_HEADING_STYLE = ParagraphStyle('SampleHeading', parent=_PDF_STYLES['Heading2'], fontSize=14, spaceAfter=10, spaceBefore=15, textColor=rl_colors.HexColor('#132F4C'), borderPadding=5)
+_SAMPLE_SMALL_STYLE = ParagraphStyle('SampleSmall', parent=_PDF_STYLES['Normal'], fontSize=9, textColor=rl_colors.HexColor('#555555'))
+_SAMPLE_FOOTER_STYLE = ParagraphStyle('SampleFooter', parent=_PDF_STYLES['Normal'], fontSize=8, textColor=rl_colors.HexColor('#888888'), alignment=TA_CENTER)
+_DOB_TITLE_STYLE = ParagraphStyle('DOBTitle', parent=_PDF_STYLES['Heading1'], fontSize=16, alignment=1)
+_DOB_FOOTER_STYLE = ParagraphStyle('DOBFooter', parent=_PDF_STYLES['Normal'], fontSize=8, textColor=rl_colors.gray, alignment=1)
+_DL_PROJECT_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), rl_colors.HexColor('#132F4C')),
+    ('TEXTCOLOR', (0, 0), (0, -1), rl_colors.white),
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('PADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 1, rl_colors.HexColor('#2D4A6F')),
+])
+_DL_SUB_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#132F4C')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('PADDING', (0, 0), (-1, -1), 5),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('GRID', (0, 0), (-1, -1), 1, rl_colors.HexColor('#2D4A6F')),
+])
+_DL_WORKER_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#FF6B00')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('PADDING', (0, 0), (-1, -1), 5),
+    ('GRID', (0, 0), (-1, -1), 1, rl_colors.HexColor('#2D4A6F')),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [rl_colors.white, rl_colors.HexColor('#F5F5F5')]),
+])
+
+def _render_daily_log_pdf(log, project, checkins):
+    """Render the daily field report PDF. Pure function of plain documents so it
+    can run in PDF_POOL worker processes."""
+    with io.BytesIO() as buffer:
         doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.5*inch, bottomMargin=0.5*inch)
-        
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle('Title', parent=styles['Heading1'], fontSize=24, spaceAfter=20, textColor=colors.HexColor('#FF6B00'))
-        heading_style = ParagraphStyle('Heading', parent=styles['Heading2'], fontSize=14, spaceAfter=10, textColor=colors.HexColor('#132F4C'))
-        normal_style = styles['Normal']
-        
+
         elements = []
-        
-        elements.append(Paragraph("BLUEVIEW", title_style))
-        elements.append(Paragraph("Daily Field Report", heading_style))
+
+        elements.append(Paragraph("BLUEVIEW", _DL_TITLE_STYLE))
+        elements.append(Paragraph("Daily Field Report", _DL_HEADING_STYLE))
         elements.append(Spacer(1, 0.2*inch))
-        
+
         weather_text = log.get("weather_conditions", "Not recorded")
         if log.get("temperature"):
             weather_text += f" ({log['temperature']}°F)"
-        
+
         project_data = [
             ["Project:", project["name"]],
             ["Location:", project["location"]],
@@ -1057,70 +1396,106 @@ def generate_daily_log_pdf(log_id: str, current_user: dict = Depends(get_current
             ["Weather:", weather_text],
             ["Status:", log.get("status", "draft").upper()],
         ]
-        project_table = Table(project_data, colWidths=[1.5*inch, 5*inch])
-        project_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#132F4C')),
-            ('TEXTCOLOR', (0, 0), (0, -1), colors.white),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('PADDING', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#2D4A6F')),
-        ]))
-        elements.append(project_table)
+        elements.append(Table(project_data, colWidths=[1.5*inch, 5*inch], style=_DL_PROJECT_TABLE_STYLE))
         elements.append(Spacer(1, 0.3*inch))
-        
-        elements.append(Paragraph(f"Workers On-Site ({len(checkins)} total)", heading_style))
+
+        elements.append(Paragraph(f"Workers On-Site ({len(checkins)} total)", _DL_HEADING_STYLE))
         if checkins:
-            worker_data = [["Name", "Trade", "Company", "OSHA #", "Check-In", "Signed"]]
-            for c in checkins:
-                check_time = c["check_in_time"].strftime("%I:%M %p") if c.get("check_in_time") else "N/A"
-                signed = "Yes" if c.get("worker_signature") else "No"
-                worker_data.append([
+            worker_data = [["Name", "Trade", "Company", "OSHA #", "Check-In", "Signed"]] + [
+                [
                     c.get("worker_name", "N/A"),
                     c.get("worker_trade", "N/A"),
                     c.get("worker_company", "N/A"),
                     c.get("worker_osha", "N/A"),
-                    check_time,
-                    signed
-                ])
-            worker_table = Table(worker_data, colWidths=[1.3*inch, 1*inch, 1.3*inch, 0.9*inch, 0.8*inch, 0.5*inch])
-            worker_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#FF6B00')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 8),
-                ('PADDING', (0, 0), (-1, -1), 5),
-                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#2D4A6F')),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F5F5F5')]),
-            ]))
-            elements.append(worker_table)
+                    c["check_in_time"].strftime("%I:%M %p") if c.get("check_in_time") else "N/A",
+                    "Yes" if c.get("worker_signature") else "No",
+                ]
+                for c in checkins
+            ]
+            elements.append(Table(worker_data, colWidths=[1.3*inch, 1*inch, 1.3*inch, 0.9*inch, 0.8*inch, 0.5*inch],
+                                  style=_DL_WORKER_TABLE_STYLE))
         elements.append(Spacer(1, 0.3*inch))
-        
-        elements.append(Paragraph("Work Summary by Subcontractor", heading_style))
-        for card in log.get("subcontractor_cards", []):
-            elements.append(Paragraph(f"<b>{card['company_name']}</b> ({card.get('worker_count', 0)} workers)", normal_style))
-            if card.get("work_description"):
-                elements.append(Paragraph(f"Work: {card['work_description']}", normal_style))
-            inspection = card.get("inspection", {})
-            elements.append(Paragraph(f"Cleanliness: {inspection.get('cleanliness', 'N/A').upper()} | Safety: {inspection.get('safety', 'N/A').upper()}", normal_style))
+
+        elements.append(Paragraph("Work Summary by Subcontractor", _DL_HEADING_STYLE))
+        cards = log.get("subcontractor_cards", [])
+        if cards:
+            # One Table flowable instead of 4-5 Paragraphs per card; free-text
+            # cells stay Paragraphs so they wrap within their column
+            sub_rows = [["Company", "Work", "Inspection"]] + [
+                [
+                    Paragraph(f"<b>{card['company_name']}</b> ({card.get('worker_count', 0)} workers)", _DL_NORMAL_STYLE),
+                    Paragraph(card.get("work_description") or "", _DL_NORMAL_STYLE),
+                    Paragraph(
+                        f"Cleanliness: {card.get('inspection', {}).get('cleanliness', 'N/A').upper()} | "
+                        f"Safety: {card.get('inspection', {}).get('safety', 'N/A').upper()}",
+                        _DL_NORMAL_STYLE
+                    ),
+                ]
+                for card in cards
+            ]
+            elements.append(Table(sub_rows, colWidths=[2*inch, 2.8*inch, 1.7*inch], style=_DL_SUB_TABLE_STYLE))
             elements.append(Spacer(1, 0.15*inch))
-        
+
         if log.get("notes"):
-            elements.append(Paragraph("Additional Notes", heading_style))
-            elements.append(Paragraph(log["notes"], normal_style))
-        
+            elements.append(Paragraph("Additional Notes", _DL_HEADING_STYLE))
+            elements.append(Paragraph(log["notes"], _DL_NORMAL_STYLE))
+
         elements.append(Spacer(1, 0.5*inch))
-        elements.append(Paragraph(f"Generated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')} | Blueview Site Operations Hub", 
-                                  ParagraphStyle('Footer', parent=normal_style, fontSize=8, textColor=colors.gray)))
-        
+        elements.append(Paragraph(f"Generated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')} | Blueview Site Operations Hub",
+                                  _DL_FOOTER_STYLE))
+
         doc.build(elements)
-        
-        pdf_base64 = base64.b64encode(buffer.getvalue()).decode()
-        return {
+
+        return buffer.getvalue()
+
+# Repeat downloads of an unchanged log (email distribution, re-opens) are a
+# dict hit; entries carry (updated_at, checkins_count) so edits and new
+# check-ins miss naturally, and update/submit pop eagerly
+_daily_log_pdf_cache = LRUCache(maxsize=128)
+
+@app.get("/api/daily-logs/{log_id}/pdf")
+async def generate_daily_log_pdf(log_id: PyObjectId, current_user: dict = Depends(get_current_user)):
+    try:
+        log = await async_db.daily_logs.find_one({"_id": ObjectId(log_id)})
+        if not log:
+            raise HTTPException(status_code=404, detail="Daily log not found")
+
+        project = await async_db.projects.find_one({"_id": ObjectId(log["project_id"])})
+        if not project:
+            raise HTTPException(status_code=404, detail="Project not found")
+
+        # _format_log_date leaves a YYYY-MM-DD string for the renderer and
+        # the filename; re-parse it for the check-in day bounds
+        _format_log_date(log)
+        log_date = datetime.strptime(log["log_date"], "%Y-%m-%d")
+        day_start = datetime.combine(log_date.date(), datetime.min.time())
+        day_end = day_start + timedelta(days=1)
+
+        checkin_filter = {
+            "project_id": log["project_id"],
+            "check_in_time": {"$gte": day_start, "$lt": day_end}
+        }
+        checkins_count = await async_db.checkins.count_documents(checkin_filter)
+
+        cached = _daily_log_pdf_cache.get(log_id)
+        if cached and cached[0] == log.get("updated_at") and cached[1] == checkins_count:
+            return cached[2]
+
+        checkins = await async_db.checkins.find(checkin_filter).to_list(length=None)
+
+        loop = asyncio.get_running_loop()
+        pdf_bytes = await loop.run_in_executor(PDF_POOL, _render_daily_log_pdf, log, project, checkins)
+
+        pdf_base64 = pybase64.b64encode_as_string(pdf_bytes)
+        response = {
             "pdf_base64": pdf_base64,
             "filename": f"DailyReport_{project['name'].replace(' ', '_')}_{log['log_date']}.pdf"
         }
-        
+        _daily_log_pdf_cache[log_id] = (log.get("updated_at"), checkins_count, response)
+        return response
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"PDF generation failed: {str(e)}")
 
@@ -1133,11 +1508,12 @@ async def send_daily_report_email(log_id: str):
         return
     
     try:
-        log = daily_logs_collection.find_one({"_id": ObjectId(log_id)})
+        log = await async_db.daily_logs.find_one({"_id": ObjectId(log_id)})
         if not log:
             return
-        
-        project = projects_collection.find_one({"_id": ObjectId(log["project_id"])})
+        _format_log_date(log)
+
+        project = await async_db.projects.find_one({"_id": ObjectId(log["project_id"])})
         if not project:
             return
         
@@ -1177,29 +1553,23 @@ async def send_daily_report_email(log_id: str):
 
 def generate_pdf_for_email(log, project):
     """Generate base64 PDF for email attachment"""
-    from reportlab.lib.pagesizes import letter
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-    from reportlab.lib.styles import getSampleStyleSheet
-    from reportlab.lib.units import inch
-    
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter)
-    styles = getSampleStyleSheet()
-    elements = []
-    
-    elements.append(Paragraph(f"Daily Report: {project['name']}", styles['Title']))
-    elements.append(Paragraph(f"Date: {log['log_date']}", styles['Normal']))
-    elements.append(Spacer(1, 0.5*inch))
-    elements.append(Paragraph(f"Weather: {log.get('weather_conditions', 'N/A')}", styles['Normal']))
-    
-    doc.build(elements)
-    return base64.b64encode(buffer.getvalue()).decode()
+    with io.BytesIO() as buffer:
+        doc = SimpleDocTemplate(buffer, pagesize=letter)
+        elements = []
+
+        elements.append(Paragraph(f"Daily Report: {project['name']}", _PDF_STYLES['Title']))
+        elements.append(Paragraph(f"Date: {log['log_date']}", _PDF_STYLES['Normal']))
+        elements.append(Spacer(1, 0.5*inch))
+        elements.append(Paragraph(f"Weather: {log.get('weather_conditions', 'N/A')}", _PDF_STYLES['Normal']))
+
+        doc.build(elements)
+        return pybase64.b64encode_as_string(buffer.getbuffer())
 
 @app.post("/api/projects/{project_id}/send-report")
 async def send_project_report(project_id: str, background_tasks: BackgroundTasks, current_user: dict = Depends(require_cp_or_admin)):
     """Manually trigger report email for a project"""
-    today = date.today().isoformat()
-    log = daily_logs_collection.find_one({"project_id": project_id, "log_date": today})
+    today = datetime.combine(date.today(), datetime.min.time())
+    log = await async_db.daily_logs.find_one({"project_id": project_id, "log_date": today})
     
     if not log:
         raise HTTPException(status_code=404, detail="No daily log found for today")
@@ -1291,16 +1661,16 @@ def link_dropbox_to_project(
         raise HTTPException(status_code=400, detail=str(e))
 
 @app.get("/api/projects/{project_id}/dropbox-files")
-async def get_dropbox_files(project_id: str, current_user: dict = Depends(get_current_user)):
+async def get_dropbox_files(project_id: PyObjectId, current_user: dict = Depends(get_current_user)):
     """List files from linked Dropbox folder"""
     import dropbox
     
     # Get user's Dropbox token
-    user = users_collection.find_one({"_id": ObjectId(current_user["id"])})
+    user = await async_db.users.find_one({"_id": ObjectId(current_user["id"])})
     if not user or not user.get("dropbox_access_token"):
         raise HTTPException(status_code=400, detail="Dropbox not connected")
     
-    project = projects_collection.find_one({"_id": ObjectId(project_id)})
+    project = await async_db.projects.find_one({"_id": ObjectId(project_id)})
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
@@ -1340,13 +1710,6 @@ def get_dropbox_status(current_user: dict = Depends(get_current_user)):
 @app.get("/api/demo/sample-report")
 def generate_sample_daily_report():
     """Generate a complete sample daily report PDF for demo purposes"""
-    from reportlab.lib.pagesizes import letter
-    from reportlab.lib import colors
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image as RLImage, PageBreak
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-    
     # Sample data for demo
     sample_project = {
         "name": "Downtown Tower Phase 2",
@@ -1407,14 +1770,14 @@ def generate_sample_daily_report():
     buffer = io.BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.4*inch, bottomMargin=0.5*inch, leftMargin=0.5*inch, rightMargin=0.5*inch)
     
-    styles = getSampleStyleSheet()
+    styles = _PDF_STYLES
     
     # Custom styles
-    title_style = ParagraphStyle('Title', parent=styles['Heading1'], fontSize=28, spaceAfter=5, textColor=colors.HexColor('#FF6B00'), alignment=TA_CENTER)
-    subtitle_style = ParagraphStyle('Subtitle', parent=styles['Normal'], fontSize=12, textColor=colors.HexColor('#666666'), alignment=TA_CENTER, spaceAfter=20)
-    heading_style = ParagraphStyle('Heading', parent=styles['Heading2'], fontSize=14, spaceAfter=10, spaceBefore=15, textColor=colors.HexColor('#132F4C'), borderPadding=5)
+    title_style = _SAMPLE_TITLE_STYLE
+    subtitle_style = _SAMPLE_SUBTITLE_STYLE
+    heading_style = _SAMPLE_HEADING_STYLE
     normal_style = styles['Normal']
-    small_style = ParagraphStyle('Small', parent=styles['Normal'], fontSize=9, textColor=colors.HexColor('#555555'))
+    small_style = _SAMPLE_SMALL_STYLE
     
     elements = []
     
@@ -1436,14 +1799,14 @@ def generate_sample_daily_report():
     ]
     project_table = Table(project_data, colWidths=[1.5*inch, 5.5*inch])
     project_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#132F4C')),
-        ('TEXTCOLOR', (0, 0), (0, -1), colors.white),
-        ('TEXTCOLOR', (1, 0), (1, -1), colors.HexColor('#333333')),
+        ('BACKGROUND', (0, 0), (0, -1), rl_colors.HexColor('#132F4C')),
+        ('TEXTCOLOR', (0, 0), (0, -1), rl_colors.white),
+        ('TEXTCOLOR', (1, 0), (1, -1), rl_colors.HexColor('#333333')),
         ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
         ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
         ('FONTSIZE', (0, 0), (-1, -1), 10),
         ('PADDING', (0, 0), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#CCCCCC')),
+        ('GRID', (0, 0), (-1, -1), 1, rl_colors.HexColor('#CCCCCC')),
         ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
     ]))
     elements.append(project_table)
@@ -1457,15 +1820,15 @@ def generate_sample_daily_report():
     ]
     weather_table = Table(weather_data, colWidths=[1.75*inch, 1.75*inch, 1.75*inch, 1.75*inch])
     weather_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4A90D9')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#4A90D9')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.white),
         ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
         ('FONTSIZE', (0, 0), (-1, -1), 11),
         ('PADDING', (0, 0), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#CCCCCC')),
+        ('GRID', (0, 0), (-1, -1), 1, rl_colors.HexColor('#CCCCCC')),
         ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
         ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('BACKGROUND', (0, 1), (-1, 1), colors.HexColor('#F5F9FF')),
+        ('BACKGROUND', (0, 1), (-1, 1), rl_colors.HexColor('#F5F9FF')),
     ]))
     elements.append(weather_table)
     elements.append(Spacer(1, 0.25*inch))
@@ -1486,18 +1849,18 @@ def generate_sample_daily_report():
     
     worker_table = Table(worker_data, colWidths=[0.35*inch, 1.4*inch, 0.95*inch, 1.25*inch, 0.9*inch, 0.8*inch, 0.5*inch])
     worker_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#FF6B00')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#FF6B00')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.white),
         ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
         ('FONTSIZE', (0, 0), (-1, 0), 9),
         ('FONTSIZE', (0, 1), (-1, -1), 8),
         ('PADDING', (0, 0), (-1, -1), 6),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#CCCCCC')),
+        ('GRID', (0, 0), (-1, -1), 0.5, rl_colors.HexColor('#CCCCCC')),
         ('ALIGN', (0, 0), (0, -1), 'CENTER'),
         ('ALIGN', (-2, 0), (-1, -1), 'CENTER'),
         ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#FFF8F3')]),
-        ('TEXTCOLOR', (-1, 1), (-1, -1), colors.HexColor('#4CAF50')),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [rl_colors.white, rl_colors.HexColor('#FFF8F3')]),
+        ('TEXTCOLOR', (-1, 1), (-1, -1), rl_colors.HexColor('#4CAF50')),
     ]))
     elements.append(worker_table)
     elements.append(Spacer(1, 0.3*inch))
@@ -1509,15 +1872,15 @@ def generate_sample_daily_report():
         sub_header = [[f"{sub['company']}", f"{sub['workers']} Workers", f"Safety: {sub['safety'].upper()}", f"Clean: {sub['cleanliness'].upper()}"]]
         sub_header_table = Table(sub_header, colWidths=[2.5*inch, 1.25*inch, 1.5*inch, 1.5*inch])
         sub_header_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, 0), colors.HexColor('#132F4C')),
-            ('TEXTCOLOR', (0, 0), (0, 0), colors.white),
+            ('BACKGROUND', (0, 0), (0, 0), rl_colors.HexColor('#132F4C')),
+            ('TEXTCOLOR', (0, 0), (0, 0), rl_colors.white),
             ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),
-            ('BACKGROUND', (1, 0), (1, 0), colors.HexColor('#2D4A6F')),
-            ('TEXTCOLOR', (1, 0), (1, 0), colors.white),
-            ('BACKGROUND', (2, 0), (2, 0), colors.HexColor('#4CAF50')),
-            ('TEXTCOLOR', (2, 0), (2, 0), colors.white),
-            ('BACKGROUND', (3, 0), (3, 0), colors.HexColor('#4CAF50')),
-            ('TEXTCOLOR', (3, 0), (3, 0), colors.white),
+            ('BACKGROUND', (1, 0), (1, 0), rl_colors.HexColor('#2D4A6F')),
+            ('TEXTCOLOR', (1, 0), (1, 0), rl_colors.white),
+            ('BACKGROUND', (2, 0), (2, 0), rl_colors.HexColor('#4CAF50')),
+            ('TEXTCOLOR', (2, 0), (2, 0), rl_colors.white),
+            ('BACKGROUND', (3, 0), (3, 0), rl_colors.HexColor('#4CAF50')),
+            ('TEXTCOLOR', (3, 0), (3, 0), rl_colors.white),
             ('FONTSIZE', (0, 0), (-1, -1), 9),
             ('PADDING', (0, 0), (-1, -1), 8),
             ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
@@ -1528,9 +1891,9 @@ def generate_sample_daily_report():
         work_desc = [[Paragraph(f"<b>Work Performed:</b> {sub['work']}", small_style)]]
         work_table = Table(work_desc, colWidths=[6.75*inch])
         work_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#F5F5F5')),
+            ('BACKGROUND', (0, 0), (-1, -1), rl_colors.HexColor('#F5F5F5')),
             ('PADDING', (0, 0), (-1, -1), 10),
-            ('BOX', (0, 0), (-1, -1), 0.5, colors.HexColor('#CCCCCC')),
+            ('BOX', (0, 0), (-1, -1), 0.5, rl_colors.HexColor('#CCCCCC')),
         ]))
         elements.append(work_table)
         elements.append(Spacer(1, 0.15*inch))
@@ -1549,16 +1912,16 @@ def generate_sample_daily_report():
     ]
     inspection_table = Table(inspection_data, colWidths=[2.5*inch, 1*inch, 3.25*inch])
     inspection_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#132F4C')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#132F4C')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.white),
         ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
         ('FONTSIZE', (0, 0), (-1, -1), 9),
         ('PADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#CCCCCC')),
+        ('GRID', (0, 0), (-1, -1), 0.5, rl_colors.HexColor('#CCCCCC')),
         ('ALIGN', (1, 0), (1, -1), 'CENTER'),
         ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F5F5F5')]),
-        ('TEXTCOLOR', (1, 1), (1, -1), colors.HexColor('#4CAF50')),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [rl_colors.white, rl_colors.HexColor('#F5F5F5')]),
+        ('TEXTCOLOR', (1, 1), (1, -1), rl_colors.HexColor('#4CAF50')),
         ('FONTNAME', (1, 1), (1, -1), 'Helvetica-Bold'),
     ]))
     elements.append(inspection_table)
@@ -1577,14 +1940,14 @@ def generate_sample_daily_report():
     
     # Footer
     elements.append(Spacer(1, 0.4*inch))
-    footer_style = ParagraphStyle('Footer', parent=styles['Normal'], fontSize=8, textColor=colors.HexColor('#888888'), alignment=TA_CENTER)
+    footer_style = _SAMPLE_FOOTER_STYLE
     elements.append(Paragraph("─" * 80, footer_style))
     elements.append(Paragraph(f"Generated by Blueview Site Operations Hub | {datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')}", footer_style))
     elements.append(Paragraph("This report is automatically generated and distributed to project stakeholders.", footer_style))
     
     doc.build(elements)
     
-    pdf_base64 = base64.b64encode(buffer.getvalue()).decode()
+    pdf_base64 = pybase64.b64encode_as_string(buffer.getbuffer())
     return {
         "pdf_base64": pdf_base64,
         "filename": f"BlueviewReport_Sample_{date.today().strftime('%Y%m%d')}.pdf",
@@ -1592,7 +1955,7 @@ def generate_sample_daily_report():
     }
 
 @app.post("/api/demo/create-sample-data")
-def create_sample_data(current_user: dict = Depends(require_admin)):
+async def create_sample_data(current_user: dict = Depends(require_admin)):
     """Create sample project, workers, and daily log for testing"""
     
     # Create sample project
@@ -1613,11 +1976,11 @@ def create_sample_data(current_user: dict = Depends(require_admin)):
     }
     
     # Check if project exists
-    existing_project = projects_collection.find_one({"name": sample_project["name"]})
+    existing_project = await async_db.projects.find_one({"name": sample_project["name"]})
     if existing_project:
         project_id = str(existing_project["_id"])
     else:
-        result = projects_collection.insert_one(sample_project)
+        result = await async_db.projects.insert_one(sample_project)
         project_id = str(result.inserted_id)
     
     # Create sample workers
@@ -1630,7 +1993,7 @@ def create_sample_data(current_user: dict = Depends(require_admin)):
     
     created_workers = []
     for w in sample_workers_data:
-        existing = workers_collection.find_one({"name": w["name"], "company": w["company"]})
+        existing = await async_db.workers.find_one({"name": w["name"], "company": w["company"]})
         if not existing:
             w["created_at"] = datetime.utcnow()
             w["updated_at"] = datetime.utcnow()
@@ -1638,14 +2001,14 @@ def create_sample_data(current_user: dict = Depends(require_admin)):
             w["id_photo"] = None
             w["osha_card_photo"] = None
             w["user_id"] = None
-            result = workers_collection.insert_one(w)
+            result = await async_db.workers.insert_one(w)
             created_workers.append(str(result.inserted_id))
         else:
             created_workers.append(str(existing["_id"]))
     
     # Create sample daily log
-    today = date.today().isoformat()
-    existing_log = daily_logs_collection.find_one({"project_id": project_id, "log_date": today})
+    today = datetime.combine(date.today(), datetime.min.time())
+    existing_log = await async_db.daily_logs.find_one({"project_id": project_id, "log_date": today})
     
     if not existing_log:
         sample_log = {
@@ -1676,7 +2039,7 @@ def create_sample_data(current_user: dict = Depends(require_admin)):
             "updated_at": datetime.utcnow(),
             "created_by": current_user["id"]
         }
-        daily_logs_collection.insert_one(sample_log)
+        await async_db.daily_logs.insert_one(sample_log)
     
     return {
         "message": "Sample data created successfully",
@@ -1688,27 +2051,27 @@ def create_sample_data(current_user: dict = Depends(require_admin)):
 # ============== SUBCONTRACTOR MANAGEMENT (Admin only) ==============
 
 @app.post("/api/admin/create-subcontractor")
-def create_subcontractor(sub: SubcontractorCreate, current_user: dict = Depends(require_admin)):
+async def create_subcontractor(sub: SubcontractorCreate, current_user: dict = Depends(require_admin)):
     """Admin creates a subcontractor account"""
-    existing = users_collection.find_one({"email": sub.email.lower()})
+    existing = await async_db.users.find_one({"email": sub.email.lower()})
     if existing:
         raise HTTPException(status_code=400, detail="Email already registered")
     
     user_dict = {
         "email": sub.email.lower(),
-        "password": hash_password(sub.password),
+        "password": await hash_password_async(sub.password),
         "name": sub.contact_name,
         "role": "subcontractor",
         "company_name": sub.company_name,
         "contact_name": sub.contact_name,
         "phone": sub.phone,
         "trade": sub.trade,
-        "assigned_projects": sub.assigned_projects,
+        "assigned_projects": to_object_ids(sub.assigned_projects),
         "created_at": datetime.utcnow(),
         "created_by": current_user["id"],
         "workers": [],  # Worker phone numbers managed by this subcontractor
     }
-    result = users_collection.insert_one(user_dict)
+    result = await async_db.users.insert_one(user_dict)
     
     return {
         "id": str(result.inserted_id),
@@ -1720,9 +2083,9 @@ def create_subcontractor(sub: SubcontractorCreate, current_user: dict = Depends(
     }
 
 @app.get("/api/admin/subcontractors")
-def get_all_subcontractors(current_user: dict = Depends(require_admin)):
+async def get_all_subcontractors(current_user: dict = Depends(require_admin)):
     """Admin gets all subcontractors"""
-    subs = list(users_collection.find({"role": "subcontractor"}))
+    subs = await async_db.users.find({"role": "subcontractor"}).to_list(length=None)
     return [{
         "id": str(s["_id"]),
         "email": s["email"],
@@ -1730,27 +2093,29 @@ def get_all_subcontractors(current_user: dict = Depends(require_admin)):
         "contact_name": s.get("contact_name"),
         "phone": s.get("phone"),
         "trade": s.get("trade"),
-        "assigned_projects": s.get("assigned_projects", []),
+        "assigned_projects": assigned_project_ids(s),
         "workers_count": len(s.get("workers", [])),
         "created_at": s.get("created_at")
     } for s in subs]
 
 @app.put("/api/admin/subcontractors/{sub_id}")
-def update_subcontractor(sub_id: str, data: SubcontractorUpdate, current_user: dict = Depends(require_admin)):
+async def update_subcontractor(sub_id: PyObjectId, data: SubcontractorUpdate, current_user: dict = Depends(require_admin)):
     """Admin updates a subcontractor"""
-    update_data = {k: v for k, v in data.model_dump().items() if v is not None}
+    update_data = data.model_dump(exclude_none=True)
+    if "assigned_projects" in update_data:
+        update_data["assigned_projects"] = to_object_ids(update_data["assigned_projects"])
     if update_data:
         update_data["updated_at"] = datetime.utcnow()
-        users_collection.update_one(
+        await async_db.users.update_one(
             {"_id": ObjectId(sub_id), "role": "subcontractor"},
             {"$set": update_data}
         )
     return {"message": "Subcontractor updated"}
 
 @app.delete("/api/admin/subcontractors/{sub_id}")
-def delete_subcontractor(sub_id: str, current_user: dict = Depends(require_admin)):
+async def delete_subcontractor(sub_id: PyObjectId, current_user: dict = Depends(require_admin)):
     """Admin deletes a subcontractor"""
-    result = users_collection.delete_one({"_id": ObjectId(sub_id), "role": "subcontractor"})
+    result = await async_db.users.delete_one({"_id": ObjectId(sub_id), "role": "subcontractor"})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Subcontractor not found")
     return {"message": "Subcontractor deleted"}
@@ -1758,7 +2123,7 @@ def delete_subcontractor(sub_id: str, current_user: dict = Depends(require_admin
 # ============== SUBCONTRACTOR: WORKER PHONE MANAGEMENT ==============
 
 @app.post("/api/subcontractor/workers")
-def add_worker_phone(worker: WorkerPhoneCreate, current_user: dict = Depends(require_subcontractor_or_admin)):
+async def add_worker_phone(worker: WorkerPhoneCreate, current_user: dict = Depends(require_subcontractor_or_admin)):
     """Subcontractor adds a worker's phone for SMS check-in"""
     worker_dict = worker.model_dump()
     worker_dict["subcontractor_id"] = current_user["id"]
@@ -1766,10 +2131,10 @@ def add_worker_phone(worker: WorkerPhoneCreate, current_user: dict = Depends(req
     worker_dict["sms_check_in_token"] = secrets.token_urlsafe(32)  # Unique token for fast login
     worker_dict["is_whitelisted"] = True
     
-    result = workers_collection.insert_one(worker_dict)
+    result = await async_db.workers.insert_one(worker_dict)
     
     # Add to subcontractor's worker list
-    users_collection.update_one(
+    await async_db.users.update_one(
         {"_id": ObjectId(current_user["id"])},
         {"$push": {"workers": str(result.inserted_id)}}
     )
@@ -1782,12 +2147,12 @@ def add_worker_phone(worker: WorkerPhoneCreate, current_user: dict = Depends(req
     }
 
 @app.get("/api/subcontractor/workers")
-def get_subcontractor_workers(current_user: dict = Depends(require_subcontractor_or_admin)):
+async def get_subcontractor_workers(current_user: dict = Depends(require_subcontractor_or_admin)):
     """Subcontractor gets their workers"""
     if current_user["role"] == "admin":
-        workers = list(workers_collection.find())
+        workers = await async_db.workers.find().to_list(length=None)
     else:
-        workers = list(workers_collection.find({"subcontractor_id": current_user["id"]}))
+        workers = await async_db.workers.find({"subcontractor_id": current_user["id"]}).to_list(length=None)
     
     return [{
         "id": str(w["_id"]),
@@ -1802,14 +2167,14 @@ def get_subcontractor_workers(current_user: dict = Depends(require_subcontractor
     } for w in workers]
 
 @app.put("/api/subcontractor/workers/{worker_id}")
-def update_worker_phone(worker_id: str, data: dict, current_user: dict = Depends(require_subcontractor_or_admin)):
+async def update_worker_phone(worker_id: PyObjectId, data: dict, current_user: dict = Depends(require_subcontractor_or_admin)):
     """Subcontractor updates a worker"""
     query = {"_id": ObjectId(worker_id)}
     if current_user["role"] != "admin":
         query["subcontractor_id"] = current_user["id"]
     
     data["updated_at"] = datetime.utcnow()
-    result = workers_collection.update_one(query, {"$set": data})
+    result = await async_db.workers.update_one(query, {"$set": data})
     
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Worker not found or access denied")
@@ -1818,11 +2183,12 @@ def update_worker_phone(worker_id: str, data: dict, current_user: dict = Depends
 # ============== MATERIAL REQUESTS ==============
 
 @app.post("/api/material-requests")
-def create_material_request(request: MaterialRequestCreate, current_user: dict = Depends(require_subcontractor_or_admin)):
+async def create_material_request(request: MaterialRequestCreate, current_user: dict = Depends(require_subcontractor_or_admin)):
     """Subcontractor submits a material request for a project"""
-    # Verify project access
+    # Verify project access; a malformed id can't match an assignment
     if current_user["role"] == "subcontractor":
-        if request.project_id not in current_user.get("assigned_projects", []):
+        if (not ObjectId.is_valid(request.project_id)
+                or ObjectId(request.project_id) not in current_user.get("assigned_projects", [])):
             raise HTTPException(status_code=403, detail="Not assigned to this project")
     
     request_dict = request.model_dump()
@@ -1832,7 +2198,7 @@ def create_material_request(request: MaterialRequestCreate, current_user: dict =
     request_dict["created_at"] = datetime.utcnow()
     request_dict["updated_at"] = datetime.utcnow()
     
-    result = material_requests_collection.insert_one(request_dict)
+    result = await async_db.material_requests.insert_one(request_dict)
     request_dict["id"] = str(result.inserted_id)
     if "_id" in request_dict:
         del request_dict["_id"]
@@ -1840,7 +2206,7 @@ def create_material_request(request: MaterialRequestCreate, current_user: dict =
     return request_dict
 
 @app.get("/api/material-requests")
-def get_material_requests(
+async def get_material_requests(
     project_id: Optional[str] = None,
     status: Optional[str] = None,
     current_user: dict = Depends(get_current_user)
@@ -1856,13 +2222,13 @@ def get_material_requests(
     if status:
         query["status"] = status
     
-    requests = list(material_requests_collection.find(query).sort("created_at", -1))
+    requests = await async_db.material_requests.find(query).sort("created_at", -1).to_list(length=None)
     return serialize_docs(requests)
 
 @app.get("/api/material-requests/{request_id}")
-def get_material_request(request_id: str, current_user: dict = Depends(get_current_user)):
+async def get_material_request(request_id: PyObjectId, current_user: dict = Depends(get_current_user)):
     """Get a specific material request"""
-    request = material_requests_collection.find_one({"_id": ObjectId(request_id)})
+    request = await async_db.material_requests.find_one({"_id": ObjectId(request_id)})
     if not request:
         raise HTTPException(status_code=404, detail="Request not found")
     
@@ -1873,28 +2239,29 @@ def get_material_request(request_id: str, current_user: dict = Depends(get_curre
     return serialize_doc(request)
 
 @app.put("/api/material-requests/{request_id}")
-def update_material_request(request_id: str, data: MaterialRequestUpdate, current_user: dict = Depends(require_admin)):
+async def update_material_request(request_id: PyObjectId, data: MaterialRequestUpdate, current_user: dict = Depends(require_admin)):
     """Admin updates material request status"""
-    update_data = {k: v for k, v in data.model_dump().items() if v is not None}
+    update_data = data.model_dump(exclude_none=True)
     update_data["updated_at"] = datetime.utcnow()
     update_data["updated_by"] = current_user["id"]
     
-    result = material_requests_collection.update_one(
+    request = await async_db.material_requests.find_one_and_update(
         {"_id": ObjectId(request_id)},
-        {"$set": update_data}
+        {"$set": update_data},
+        return_document=ReturnDocument.AFTER
     )
-    
-    if result.matched_count == 0:
+
+    if request is None:
         raise HTTPException(status_code=404, detail="Request not found")
-    
-    return get_material_request(request_id, current_user)
+
+    return serialize_doc(request)
 
 # ============== GEOFENCING (Radar.io - MOCKED) ==============
 
 @app.post("/api/projects/{project_id}/geofence")
-def set_project_geofence(project_id: str, config: GeofenceConfig, current_user: dict = Depends(require_admin)):
+async def set_project_geofence(project_id: PyObjectId, config: GeofenceConfig, current_user: dict = Depends(require_admin)):
     """Admin sets geofence for a project"""
-    projects_collection.update_one(
+    await async_db.projects.update_one(
         {"_id": ObjectId(project_id)},
         {"$set": {
             "geofence": config.model_dump(),
@@ -1910,9 +2277,9 @@ def set_project_geofence(project_id: str, config: GeofenceConfig, current_user:
     return {"message": "Geofence configured", "config": config.model_dump()}
 
 @app.get("/api/projects/{project_id}/geofence")
-def get_project_geofence(project_id: str, current_user: dict = Depends(get_current_user)):
+async def get_project_geofence(project_id: PyObjectId, current_user: dict = Depends(get_current_user)):
     """Get geofence config for a project"""
-    project = projects_collection.find_one({"_id": ObjectId(project_id)})
+    project = await async_db.projects.find_one({"_id": ObjectId(project_id)})
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
@@ -1931,7 +2298,7 @@ async def handle_geofence_entry(
     Triggers SMS with fast login link
     """
     # Find worker by phone
-    worker = workers_collection.find_one({"phone": phone, "is_whitelisted": True})
+    worker = await async_db.workers.find_one({"phone": phone, "is_whitelisted": True})
     if not worker:
         return {"status": "ignored", "reason": "Phone not whitelisted"}
     
@@ -1946,11 +2313,11 @@ async def handle_geofence_entry(
         "timestamp": datetime.utcnow(),
         "sms_sent": False
     }
-    event_result = geofence_events_collection.insert_one(event)
+    event_result = await async_db.geofence_events.insert_one(event)
     
     # Generate fast login token
     fast_login_token = secrets.token_urlsafe(32)
-    workers_collection.update_one(
+    await async_db.workers.update_one(
         {"_id": worker["_id"]},
         {"$set": {
             "fast_login_token": fast_login_token,
@@ -1978,7 +2345,7 @@ async def handle_geofence_entry(
 async def send_checkin_sms(phone: str, token: str, project_id: str, event_id: str):
     """Send SMS with fast login link via Twilio"""
     # Get project name
-    project = projects_collection.find_one({"_id": ObjectId(project_id)})
+    project = await async_db.projects.find_one({"_id": ObjectId(project_id)})
     project_name = project["name"] if project else "Job Site"
     
     # Build fast login URL
@@ -2019,21 +2386,21 @@ async def send_checkin_sms(phone: str, token: str, project_id: str, event_id: st
         sms_log["note"] = "Twilio credentials not configured. SMS would be sent in production."
         print(f"[MOCKED SMS] To: {phone}, Message: {message}")
     
-    sms_logs_collection.insert_one(sms_log)
+    await async_db.sms_logs.insert_one(sms_log)
     
     # Update geofence event
-    geofence_events_collection.update_one(
+    await async_db.geofence_events.update_one(
         {"_id": ObjectId(event_id)},
         {"$set": {"sms_sent": True, "sms_status": sms_log["status"]}}
     )
 
 @app.post("/api/checkin/fast-login")
-def fast_login_checkin(data: SMSCheckInRequest):
+async def fast_login_checkin(data: SMSCheckInRequest):
     """
     Fast login via SMS link - auto-authenticates worker and logs check-in
     """
     # Find worker by token
-    worker = workers_collection.find_one({
+    worker = await async_db.workers.find_one({
         "fast_login_token": data.token,
         "fast_login_expires": {"$gt": datetime.utcnow()}
     })
@@ -2055,10 +2422,10 @@ def fast_login_checkin(data: SMSCheckInRequest):
         "check_in_method": "sms_fast_login",
         "gps_confirmed": True
     }
-    checkins_collection.insert_one(checkin)
+    await async_db.checkins.insert_one(checkin)
     
     # Invalidate the fast login token
-    workers_collection.update_one(
+    await async_db.workers.update_one(
         {"_id": worker["_id"]},
         {"$unset": {"fast_login_token": "", "fast_login_expires": ""}}
     )
@@ -2077,7 +2444,7 @@ def fast_login_checkin(data: SMSCheckInRequest):
 # ============== NYC DOB DAILY LOG ==============
 
 @app.post("/api/dob-daily-log/{project_id}")
-def create_or_append_dob_log(project_id: str, entry: DOBDailyLogEntry, current_user: dict = Depends(get_current_user)):
+async def create_or_append_dob_log(project_id: str, entry: DOBDailyLogEntry, current_user: dict = Depends(get_current_user)):
     """
     Create or append to NYC DOB Daily Log for a project
     Auto-appends worker credentials when they check in
@@ -2085,13 +2452,13 @@ def create_or_append_dob_log(project_id: str, entry: DOBDailyLogEntry, current_u
     today = date.today().isoformat()
     
     # Get or create today's DOB log
-    dob_log = dob_daily_logs_collection.find_one({
+    dob_log = await async_db.dob_daily_logs.find_one({
         "project_id": project_id,
         "log_date": today
     })
     
     # Get worker details
-    worker = workers_collection.find_one({"_id": ObjectId(entry.worker_id)})
+    worker = await async_db.workers.find_one({"_id": ObjectId(entry.worker_id)})
     if not worker:
         raise HTTPException(status_code=404, detail="Worker not found")
     
@@ -2113,7 +2480,7 @@ def create_or_append_dob_log(project_id: str, entry: DOBDailyLogEntry, current_u
     
     if dob_log:
         # Append to existing log
-        dob_daily_logs_collection.update_one(
+        await async_db.dob_daily_logs.update_one(
             {"_id": dob_log["_id"]},
             {
                 "$push": {"workers": worker_entry},
@@ -2123,7 +2490,7 @@ def create_or_append_dob_log(project_id: str, entry: DOBDailyLogEntry, current_u
         return {"message": "Worker appended to DOB log", "log_id": str(dob_log["_id"])}
     else:
         # Create new DOB log
-        project = projects_collection.find_one({"_id": ObjectId(project_id)})
+        project = await async_db.projects.find_one({"_id": ObjectId(project_id)})
         
         new_log = {
             "project_id": project_id,
@@ -2136,13 +2503,13 @@ def create_or_append_dob_log(project_id: str, entry: DOBDailyLogEntry, current_u
             "status": "active",
             "dob_compliant": True
         }
-        result = dob_daily_logs_collection.insert_one(new_log)
+        result = await async_db.dob_daily_logs.insert_one(new_log)
         return {"message": "DOB log created", "log_id": str(result.inserted_id)}
 
 @app.get("/api/dob-daily-log/{project_id}/{log_date}")
-def get_dob_daily_log(project_id: str, log_date: str, current_user: dict = Depends(get_current_user)):
+async def get_dob_daily_log(project_id: str, log_date: str, current_user: dict = Depends(get_current_user)):
     """Get DOB Daily Log for a specific date"""
-    log = dob_daily_logs_collection.find_one({
+    log = await async_db.dob_daily_logs.find_one({
         "project_id": project_id,
         "log_date": log_date
     })
@@ -2153,21 +2520,15 @@ def get_dob_daily_log(project_id: str, log_date: str, current_user: dict = Depen
     return serialize_doc(log)
 
 @app.get("/api/dob-daily-log/{project_id}/export")
-def export_dob_log_pdf(project_id: str, log_date: str = None, current_user: dict = Depends(get_current_user)):
+async def export_dob_log_pdf(project_id: str, log_date: str = None, current_user: dict = Depends(get_current_user)):
     """
     Export NYC DOB compliant Daily Log as PDF
     Format meets NYC DOB site safety requirements
     """
-    from reportlab.lib.pagesizes import letter
-    from reportlab.lib import colors
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    
     if not log_date:
         log_date = date.today().isoformat()
     
-    log = dob_daily_logs_collection.find_one({
+    log = await async_db.dob_daily_logs.find_one({
         "project_id": project_id,
         "log_date": log_date
     })
@@ -2175,13 +2536,13 @@ def export_dob_log_pdf(project_id: str, log_date: str = None, current_user: dict
     if not log:
         raise HTTPException(status_code=404, detail="No DOB log for this date")
     
-    project = projects_collection.find_one({"_id": ObjectId(project_id)})
+    project = await async_db.projects.find_one({"_id": ObjectId(project_id)})
     
     buffer = io.BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.5*inch, bottomMargin=0.5*inch)
-    styles = getSampleStyleSheet()
+    styles = _PDF_STYLES
     
-    title_style = ParagraphStyle('Title', parent=styles['Heading1'], fontSize=16, alignment=1)
+    title_style = _DOB_TITLE_STYLE
     
     elements = []
     
@@ -2226,14 +2587,14 @@ def export_dob_log_pdf(project_id: str, log_date: str = None, current_user: dict
     
     worker_table = Table(worker_data, colWidths=[0.4*inch, 1.2*inch, 0.8*inch, 1*inch, 0.8*inch, 0.8*inch, 0.7*inch, 0.4*inch])
     worker_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#003366')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#003366')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.white),
         ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
         ('FONTSIZE', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.gray),
+        ('GRID', (0, 0), (-1, -1), 0.5, rl_colors.gray),
         ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
         ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F5F5F5')]),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [rl_colors.white, rl_colors.HexColor('#F5F5F5')]),
     ]))
     elements.append(worker_table)
     
@@ -2241,12 +2602,12 @@ def export_dob_log_pdf(project_id: str, log_date: str = None, current_user: dict
     elements.append(Spacer(1, 0.5*inch))
     elements.append(Paragraph(
         f"Generated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')} | NYC DOB Compliant Format",
-        ParagraphStyle('Footer', parent=styles['Normal'], fontSize=8, textColor=colors.gray, alignment=1)
+        _DOB_FOOTER_STYLE
     ))
     
     doc.build(elements)
     
-    pdf_base64 = base64.b64encode(buffer.getvalue()).decode()
+    pdf_base64 = pybase64.b64encode_as_string(buffer.getbuffer())
     return {
         "pdf_base64": pdf_base64,
         "filename": f"DOB_DailyLog_{project_id}_{log_date}.pdf"
@@ -2318,7 +2679,7 @@ async def view_document(project_id: str, file_path: str, current_user: dict = De
     Returns temporary download link
     """
     # Get admin's token
-    admin = users_collection.find_one({"role": "admin", "dropbox_access_token": {"$exists": True}})
+    admin = await async_db.users.find_one({"role": "admin", "dropbox_access_token": {"$exists": True}})
     if not admin:
         raise HTTPException(status_code=400, detail="Dropbox not configured")
     
@@ -2345,9 +2706,9 @@ async def view_document(project_id: str, file_path: str, current_user: dict = De
 OWNER_MASTER_KEY = "BlueviewOwner2025!"
 
 @app.get("/api/owner/admins")
-def get_all_admins():
+async def get_all_admins():
     """Owner gets all admin accounts (companies)"""
-    admins = list(users_collection.find({"role": "admin"}))
+    admins = await async_db.users.find({"role": "admin"}).to_list(length=None)
     return [{
         "id": str(a["_id"]),
         "email": a["email"],
@@ -2358,7 +2719,7 @@ def get_all_admins():
     } for a in admins]
 
 @app.post("/api/owner/create-admin")
-def owner_create_admin(data: dict):
+async def owner_create_admin(data: dict):
     """Owner creates a new admin account for a paying company"""
     if data.get("owner_key") != OWNER_MASTER_KEY:
         raise HTTPException(status_code=403, detail="Invalid owner credentials")
@@ -2367,13 +2728,13 @@ def owner_create_admin(data: dict):
     if not email or not data.get("password") or not data.get("company_name"):
         raise HTTPException(status_code=400, detail="Email, password, and company name required")
     
-    existing = users_collection.find_one({"email": email})
+    existing = await async_db.users.find_one({"email": email})
     if existing:
         raise HTTPException(status_code=400, detail="Email already registered")
     
     admin_dict = {
         "email": email,
-        "password": hash_password(data["password"]),
+        "password": await hash_password_async(data["password"]),
         "name": data.get("contact_name", "Admin"),
         "company_name": data["company_name"],
         "contact_name": data.get("contact_name", ""),
@@ -2383,7 +2744,7 @@ def owner_create_admin(data: dict):
         "is_active": True,
         "created_by_owner": True
     }
-    result = users_collection.insert_one(admin_dict)
+    result = await async_db.users.insert_one(admin_dict)
     
     return {
         "id": str(result.inserted_id),
@@ -2393,19 +2754,19 @@ def owner_create_admin(data: dict):
     }
 
 @app.delete("/api/owner/admins/{admin_id}")
-def owner_delete_admin(admin_id: str, owner_key: str):
+async def owner_delete_admin(admin_id: PyObjectId, owner_key: str):
     """Owner deletes an admin account"""
     if owner_key != OWNER_MASTER_KEY:
         raise HTTPException(status_code=403, detail="Invalid owner credentials")
     
-    result = users_collection.delete_one({"_id": ObjectId(admin_id), "role": "admin"})
+    result = await async_db.users.delete_one({"_id": ObjectId(admin_id), "role": "admin"})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Admin not found")
     
     return {"message": "Admin account deleted"}
 
 @app.put("/api/owner/admins/{admin_id}")
-def owner_update_admin(admin_id: str, data: dict):
+async def owner_update_admin(admin_id: PyObjectId, data: dict):
     """Owner updates an admin account"""
     if data.get("owner_key") != OWNER_MASTER_KEY:
         raise HTTPException(status_code=403, detail="Invalid owner credentials")
@@ -2416,11 +2777,11 @@ def owner_update_admin(admin_id: str, data: dict):
     if "company_name" in data:
         update_data["company_name"] = data["company_name"]
     if "password" in data:
-        update_data["password"] = hash_password(data["password"])
+        update_data["password"] = await hash_password_async(data["password"])
     
     if update_data:
         update_data["updated_at"] = datetime.utcnow()
-        users_collection.update_one(
+        await async_db.users.update_one(
             {"_id": ObjectId(admin_id), "role": "admin"},
             {"$set": update_data}
         )
@@ -2430,7 +2791,7 @@ def owner_update_admin(admin_id: str, data: dict):
 # ============== REPORT SETTINGS (Admin) ==============
 
 @app.post("/api/projects/{project_id}/report-settings")
-def create_report_settings(project_id: str, settings: ReportSettingsCreate, current_user: dict = Depends(require_admin)):
+async def create_report_settings(project_id: str, settings: ReportSettingsCreate, current_user: dict = Depends(require_admin)):
     """Admin configures report settings for a project"""
     settings_dict = settings.model_dump()
     settings_dict["project_id"] = project_id
@@ -2439,7 +2800,7 @@ def create_report_settings(project_id: str, settings: ReportSettingsCreate, curr
     settings_dict["updated_at"] = datetime.utcnow()
     
     # Upsert - update if exists, create if not
-    report_settings_collection.update_one(
+    await async_db.report_settings.update_one(
         {"project_id": project_id},
         {"$set": settings_dict},
         upsert=True
@@ -2448,9 +2809,9 @@ def create_report_settings(project_id: str, settings: ReportSettingsCreate, curr
     return {"message": "Report settings saved", "project_id": project_id}
 
 @app.get("/api/projects/{project_id}/report-settings")
-def get_report_settings(project_id: str, current_user: dict = Depends(require_admin)):
+async def get_report_settings(project_id: str, current_user: dict = Depends(require_admin)):
     """Get report settings for a project"""
-    settings = report_settings_collection.find_one({"project_id": project_id})
+    settings = await async_db.report_settings.find_one({"project_id": project_id})
     if not settings:
         return {
             "project_id": project_id,
@@ -2466,14 +2827,14 @@ def get_report_settings(project_id: str, current_user: dict = Depends(require_ad
 # ============== TRADE MAPPINGS (Admin) ==============
 
 @app.post("/api/trade-mappings")
-def create_trade_mapping(mapping: TradeMappingCreate, current_user: dict = Depends(require_admin)):
+async def create_trade_mapping(mapping: TradeMappingCreate, current_user: dict = Depends(require_admin)):
     """Admin creates trade to legal subcontractor name mapping"""
     mapping_dict = mapping.model_dump()
     mapping_dict["admin_id"] = current_user["id"]
     mapping_dict["created_at"] = datetime.utcnow()
     
     # Upsert by trade name
-    trade_mappings_collection.update_one(
+    await async_db.trade_mappings.update_one(
         {"trade": mapping.trade, "admin_id": current_user["id"]},
         {"$set": mapping_dict},
         upsert=True
@@ -2482,23 +2843,23 @@ def create_trade_mapping(mapping: TradeMappingCreate, current_user: dict = Depen
     return {"message": f"Mapping saved: {mapping.trade} → {mapping.legal_name}"}
 
 @app.get("/api/trade-mappings")
-def get_trade_mappings(current_user: dict = Depends(require_admin)):
+async def get_trade_mappings(current_user: dict = Depends(require_admin)):
     """Get all trade mappings for admin"""
-    mappings = list(trade_mappings_collection.find({"admin_id": current_user["id"]}))
+    mappings = await async_db.trade_mappings.find({"admin_id": current_user["id"]}).to_list(length=None)
     return serialize_docs(mappings)
 
 @app.delete("/api/trade-mappings/{mapping_id}")
-def delete_trade_mapping(mapping_id: str, current_user: dict = Depends(require_admin)):
+async def delete_trade_mapping(mapping_id: PyObjectId, current_user: dict = Depends(require_admin)):
     """Delete a trade mapping"""
-    trade_mappings_collection.delete_one({"_id": ObjectId(mapping_id), "admin_id": current_user["id"]})
+    await async_db.trade_mappings.delete_one({"_id": ObjectId(mapping_id), "admin_id": current_user["id"]})
     return {"message": "Mapping deleted"}
 
 # ============== NFC TAG MANAGEMENT ==============
 
 @app.post("/api/nfc-tags")
-def register_nfc_tag(tag: NFCTagCreate, current_user: dict = Depends(require_admin)):
+async def register_nfc_tag(tag: NFCTagCreate, current_user: dict = Depends(require_admin)):
     """Admin registers an NFC tag for a job site"""
-    existing = nfc_tags_collection.find_one({"tag_id": tag.tag_id})
+    existing = await async_db.nfc_tags.find_one({"tag_id": tag.tag_id})
     if existing:
         raise HTTPException(status_code=400, detail="NFC tag already registered")
     
@@ -2507,7 +2868,7 @@ def register_nfc_tag(tag: NFCTagCreate, current_user: dict = Depends(require_adm
     tag_dict["created_at"] = datetime.utcnow()
     tag_dict["is_active"] = True
     
-    result = nfc_tags_collection.insert_one(tag_dict)
+    result = await async_db.nfc_tags.insert_one(tag_dict)
     
     return {
         "id": str(result.inserted_id),
@@ -2517,19 +2878,19 @@ def register_nfc_tag(tag: NFCTagCreate, current_user: dict = Depends(require_adm
     }
 
 @app.get("/api/nfc-tags")
-def get_nfc_tags(current_user: dict = Depends(require_admin)):
+async def get_nfc_tags(current_user: dict = Depends(require_admin)):
     """Get all NFC tags"""
-    tags = list(nfc_tags_collection.find({"admin_id": current_user["id"]}))
+    tags = await async_db.nfc_tags.find({"admin_id": current_user["id"]}).to_list(length=None)
     return serialize_docs(tags)
 
 @app.get("/api/nfc-tags/{tag_id}/info")
-def get_nfc_tag_info(tag_id: str):
+async def get_nfc_tag_info(tag_id: str):
     """Public endpoint - Get project info for NFC tag (used when worker scans)"""
-    tag = nfc_tags_collection.find_one({"tag_id": tag_id, "is_active": True})
+    tag = await async_db.nfc_tags.find_one({"tag_id": tag_id, "is_active": True})
     if not tag:
         raise HTTPException(status_code=404, detail="NFC tag not found or inactive")
     
-    project = projects_collection.find_one({"_id": ObjectId(tag["project_id"])})
+    project = await async_db.projects.find_one({"_id": ObjectId(tag["project_id"])})
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
@@ -2544,15 +2905,15 @@ def get_nfc_tag_info(tag_id: str):
 # ============== NFC CHECK-IN ==============
 
 @app.post("/api/nfc-checkin")
-def nfc_worker_checkin(checkin: NFCCheckInRequest):
+async def nfc_worker_checkin(checkin: NFCCheckInRequest):
     """Worker checks in via NFC tag scan"""
     # Verify NFC tag
-    tag = nfc_tags_collection.find_one({"tag_id": checkin.tag_id, "is_active": True})
+    tag = await async_db.nfc_tags.find_one({"tag_id": checkin.tag_id, "is_active": True})
     if not tag:
         raise HTTPException(status_code=404, detail="Invalid NFC tag")
     
     # Get worker
-    worker = workers_collection.find_one({"_id": ObjectId(checkin.worker_id)})
+    worker = await async_db.workers.find_one({"_id": ObjectId(checkin.worker_id)})
     if not worker:
         raise HTTPException(status_code=404, detail="Worker not found")
     
@@ -2572,7 +2933,7 @@ def nfc_worker_checkin(checkin: NFCCheckInRequest):
         "date": date.today().isoformat()
     }
     
-    result = checkins_collection.insert_one(checkin_record)
+    result = await async_db.checkins.insert_one(checkin_record)
     
     return {
         "checkin_id": str(result.inserted_id),
@@ -2583,9 +2944,9 @@ def nfc_worker_checkin(checkin: NFCCheckInRequest):
     }
 
 @app.post("/api/nfc-checkout/{checkin_id}")
-def nfc_worker_checkout(checkin_id: str, signature: Optional[str] = None):
+async def nfc_worker_checkout(checkin_id: PyObjectId, signature: Optional[str] = None):
     """Worker checks out"""
-    result = checkins_collection.update_one(
+    result = await async_db.checkins.update_one(
         {"_id": ObjectId(checkin_id), "check_out_time": None},
         {"$set": {
             "check_out_time": datetime.utcnow(),
@@ -2611,8 +2972,7 @@ class OSHACardOCRRequest(BaseModel):
 def ocr_osha_card(request: OSHACardOCRRequest):
     """Extract info from OSHA card photo using Gemini Vision"""
     import google.generativeai as genai
-    import json
-    
+
     GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
     if not GEMINI_API_KEY:
         raise HTTPException(status_code=500, detail="OCR service not configured")
@@ -2622,7 +2982,7 @@ def ocr_osha_card(request: OSHACardOCRRequest):
         model = genai.GenerativeModel('gemini-2.0-flash')
         
         # Decode base64 image
-        image_data = base64.b64decode(request.image_base64)
+        image_data = pybase64.b64decode(request.image_base64, validate=False)
         
         # Create image part for Gemini
         image_part = {
@@ -2650,7 +3010,7 @@ Return ONLY valid JSON, no other text or explanation."""
                 response_text = response_text[4:]
         response_text = response_text.strip()
         
-        extracted_data = json.loads(response_text)
+        extracted_data = orjson.loads(response_text)
         
         return {
             "success": True,
@@ -2663,7 +3023,7 @@ Return ONLY valid JSON, no other text or explanation."""
             }
         }
         
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         return {
             "success": False,
             "error": "Could not parse card information",
@@ -2677,10 +3037,10 @@ Return ONLY valid JSON, no other text or explanation."""
         }
 
 @app.post("/api/passport/create")
-def create_worker_passport_new(passport: WorkerPassportCreate):
+async def create_worker_passport_new(passport: WorkerPassportCreate):
     """Create a new worker passport (one-time registration)"""
     # Check if passport already exists with this OSHA number
-    existing = worker_passports_collection.find_one({"osha_number": passport.osha_number})
+    existing = await async_db.worker_passports.find_one({"osha_number": passport.osha_number})
     if existing:
         # Return existing passport
         return {
@@ -2708,7 +3068,7 @@ def create_worker_passport_new(passport: WorkerPassportCreate):
         "total_checkins": 0
     }
     
-    result = worker_passports_collection.insert_one(passport_doc)
+    result = await async_db.worker_passports.insert_one(passport_doc)
     passport_doc["_id"] = result.inserted_id
     
     return {
@@ -2719,28 +3079,25 @@ def create_worker_passport_new(passport: WorkerPassportCreate):
     }
 
 @app.get("/api/passport/{passport_id}")
-def get_worker_passport(passport_id: str):
+async def get_worker_passport(passport_id: PyObjectId):
     """Get worker passport by ID"""
-    try:
-        passport = worker_passports_collection.find_one({"_id": ObjectId(passport_id)})
-        if not passport:
-            raise HTTPException(status_code=404, detail="Passport not found")
-        return serialize_doc(passport)
-    except Exception:
-        raise HTTPException(status_code=404, detail="Invalid passport ID")
+    passport = await async_db.worker_passports.find_one({"_id": ObjectId(passport_id)})
+    if not passport:
+        raise HTTPException(status_code=404, detail="Passport not found")
+    return serialize_doc(passport)
 
 @app.get("/api/passport/by-osha/{osha_number}")
-def get_passport_by_osha(osha_number: str):
+async def get_passport_by_osha(osha_number: str):
     """Get worker passport by OSHA number"""
-    passport = worker_passports_collection.find_one({"osha_number": osha_number})
+    passport = await async_db.worker_passports.find_one({"osha_number": osha_number})
     if not passport:
         raise HTTPException(status_code=404, detail="Passport not found")
     return serialize_doc(passport)
 
 @app.get("/api/passport/registered-workers")
-def get_registered_workers(current_user: dict = Depends(require_admin)):
+async def get_registered_workers(current_user: dict = Depends(require_admin)):
     """Admin endpoint - Get all registered worker passports"""
-    passports = list(worker_passports_collection.find({"is_active": True}).sort("created_at", -1))
+    passports = await async_db.worker_passports.find({"is_active": True}).sort("created_at", -1).to_list(length=None)
     
     result = []
     for p in passports:
@@ -2761,27 +3118,24 @@ def get_registered_workers(current_user: dict = Depends(require_admin)):
     return result
 
 @app.delete("/api/passport/{passport_id}")
-def delete_worker_passport(passport_id: str, current_user: dict = Depends(require_admin)):
+async def delete_worker_passport(passport_id: PyObjectId, current_user: dict = Depends(require_admin)):
     """Admin endpoint - Delete/deactivate a worker passport"""
-    try:
-        result = worker_passports_collection.update_one(
-            {"_id": ObjectId(passport_id)},
-            {"$set": {"is_active": False, "deactivated_at": datetime.utcnow(), "deactivated_by": current_user["id"]}}
-        )
-        if result.matched_count == 0:
-            raise HTTPException(status_code=404, detail="Passport not found")
-        return {"message": "Passport deactivated successfully"}
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    result = await async_db.worker_passports.update_one(
+        {"_id": ObjectId(passport_id)},
+        {"$set": {"is_active": False, "deactivated_at": datetime.utcnow(), "deactivated_by": current_user["id"]}}
+    )
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="Passport not found")
+    return {"message": "Passport deactivated successfully"}
 
 @app.post("/api/passport/checkin")
-def passport_nfc_checkin(checkin: NFCPassportCheckinRequest):
+async def passport_nfc_checkin(checkin: NFCPassportCheckinRequest):
     """
     Worker checks in using their stored passport - AUTO SIGNS ALL BOOKS
     This is the main endpoint for returning workers
     """
     # Verify NFC tag
-    tag = nfc_tags_collection.find_one({"tag_id": checkin.tag_id, "is_active": True})
+    tag = await async_db.nfc_tags.find_one({"tag_id": checkin.tag_id, "is_active": True})
     if not tag:
         raise HTTPException(status_code=404, detail="Invalid NFC tag")
     
@@ -2789,7 +3143,7 @@ def passport_nfc_checkin(checkin: NFCPassportCheckinRequest):
     
     # Get worker passport
     try:
-        passport = worker_passports_collection.find_one({"_id": ObjectId(checkin.device_passport_id)})
+        passport = await async_db.worker_passports.find_one({"_id": ObjectId(checkin.device_passport_id)})
     except:
         raise HTTPException(status_code=404, detail="Invalid passport ID")
     
@@ -2800,7 +3154,7 @@ def passport_nfc_checkin(checkin: NFCPassportCheckinRequest):
     now = datetime.utcnow()
     
     # Check if already checked in today
-    existing_checkin = checkins_collection.find_one({
+    existing_checkin = await async_db.checkins.find_one({
         "passport_id": checkin.device_passport_id,
         "project_id": project_id,
         "date": today,
@@ -2836,11 +3190,11 @@ def passport_nfc_checkin(checkin: NFCPassportCheckinRequest):
         "auto_signed": True
     }
     
-    checkin_result = checkins_collection.insert_one(checkin_record)
+    checkin_result = await async_db.checkins.insert_one(checkin_record)
     
     # 2. SAFETY MEETING / TOOLBOX TALK (Auto-sign for today)
     # Find or create today's safety meeting for this project
-    safety_meeting = safety_meetings_collection.find_one({
+    safety_meeting = await async_db.safety_meetings.find_one({
         "project_id": project_id,
         "meeting_date": today
     })
@@ -2853,7 +3207,7 @@ def passport_nfc_checkin(checkin: NFCPassportCheckinRequest):
             for a in safety_meeting.get("attendees", [])
         )
         if not existing_attendee:
-            safety_meetings_collection.update_one(
+            await async_db.safety_meetings.update_one(
                 {"_id": safety_meeting["_id"]},
                 {"$push": {"attendees": {
                     "worker_name": passport.get("name"),
@@ -2865,7 +3219,7 @@ def passport_nfc_checkin(checkin: NFCPassportCheckinRequest):
             safety_meeting_signed = True
     else:
         # Create a placeholder safety meeting for today
-        safety_meetings_collection.insert_one({
+        await async_db.safety_meetings.insert_one({
             "project_id": project_id,
             "meeting_date": today,
             "meeting_time": now.strftime("%H:%M"),
@@ -2885,7 +3239,7 @@ def passport_nfc_checkin(checkin: NFCPassportCheckinRequest):
     
     if site_orientation_needed:
         # Record site orientation
-        site_orientations_collection.insert_one({
+        await async_db.site_orientations.insert_one({
             "passport_id": checkin.device_passport_id,
             "worker_name": passport.get("name"),
             "osha_number": passport.get("osha_number"),
@@ -2903,14 +3257,14 @@ def passport_nfc_checkin(checkin: NFCPassportCheckinRequest):
         })
         
         # Mark site as visited in passport
-        worker_passports_collection.update_one(
+        await async_db.worker_passports.update_one(
             {"_id": ObjectId(checkin.device_passport_id)},
             {"$addToSet": {"sites_visited": project_id}}
         )
         site_orientation_signed = True
     
     # Update passport stats
-    worker_passports_collection.update_one(
+    await async_db.worker_passports.update_one(
         {"_id": ObjectId(checkin.device_passport_id)},
         {
             "$inc": {"total_checkins": 1},
@@ -2919,7 +3273,7 @@ def passport_nfc_checkin(checkin: NFCPassportCheckinRequest):
     )
     
     # Get project name for response
-    project = projects_collection.find_one({"_id": ObjectId(project_id)})
+    project = await async_db.projects.find_one({"_id": ObjectId(project_id)})
     project_name = project.get("name", "Job Site") if project else "Job Site"
     
     return {
@@ -2941,20 +3295,20 @@ def passport_nfc_checkin(checkin: NFCPassportCheckinRequest):
 # ============== SAFETY MEETING ==============
 
 @app.post("/api/safety-meetings")
-def create_safety_meeting(meeting: SafetyMeetingCreate, current_user: dict = Depends(get_current_user)):
+async def create_safety_meeting(meeting: SafetyMeetingCreate, current_user: dict = Depends(get_current_user)):
     """Create pre-shift safety meeting record"""
     meeting_dict = meeting.model_dump()
     meeting_dict["created_by"] = current_user["id"]
     meeting_dict["created_at"] = datetime.utcnow()
     
-    result = safety_meetings_collection.insert_one(meeting_dict)
+    result = await async_db.safety_meetings.insert_one(meeting_dict)
     
     return {"id": str(result.inserted_id), "message": "Safety meeting recorded"}
 
 @app.get("/api/safety-meetings/{project_id}/{meeting_date}")
-def get_safety_meeting(project_id: str, meeting_date: str, current_user: dict = Depends(get_current_user)):
+async def get_safety_meeting(project_id: str, meeting_date: str, current_user: dict = Depends(get_current_user)):
     """Get safety meeting for a specific date"""
-    meeting = safety_meetings_collection.find_one({
+    meeting = await async_db.safety_meetings.find_one({
         "project_id": project_id,
         "meeting_date": meeting_date
     })
@@ -2964,6 +3318,81 @@ def get_safety_meeting(project_id: str, meeting_date: str, current_user: dict =
 
 # ============== DAILY REPORT PDF GENERATION ==============
 
+# Shared table style commands for the report builders, parsed once at import
+# instead of per request. Alternating stripes are emitted as explicit per-row
+# BACKGROUND commands - cheaper than ReportLab resolving ROWBACKGROUNDS during
+# every render of a large table.
+_STRIPE_GRAY = rl_colors.HexColor('#F5F5F5')
+_STRIPE_ORANGE = rl_colors.HexColor('#FFF5EB')
+
+_JOBSITE_ACTIVITY_CMDS = (
+    ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#003366')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 0.5, rl_colors.gray),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+)
+
+_MANPOWER_SUMMARY_CMDS = (
+    ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#FF6B00')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 0.5, rl_colors.gray),
+    ('ALIGN', (-1, 0), (-1, -1), 'CENTER'),
+)
+
+_MANPOWER_LEDGER_CMDS = (
+    ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#003366')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 0.5, rl_colors.gray),
+    ('ALIGN', (0, 0), (1, -1), 'CENTER'),
+)
+
+_ATTENDANCE_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#003366')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('GRID', (0, 0), (-1, -1), 0.5, rl_colors.gray),
+    ('ALIGN', (0, 0), (0, -1), 'CENTER'),
+])
+
+# Defaults merged over each check-in doc so the per-row loops below do bare
+# subscripts instead of five or six dict.get calls per row
+_CHECKIN_ROW_DEFAULTS = {
+    "worker_name": "N/A",
+    "worker_trade": "N/A",
+    "worker_company": "Unknown",
+    "worker_osha_number": "N/A",
+    "check_in_time": None,
+    "signature": None,
+}
+
+_JOBSITE_TITLE_STYLE = ParagraphStyle('JobsiteTitle', parent=_PDF_STYLES['Heading1'], fontSize=14, alignment=1, spaceAfter=5)
+_JOBSITE_SUBTITLE_STYLE = ParagraphStyle('JobsiteSubtitle', parent=_PDF_STYLES['Normal'], fontSize=9, alignment=1, textColor=rl_colors.gray)
+_JOBSITE_SECTION_STYLE = ParagraphStyle('JobsiteSection', parent=_PDF_STYLES['Heading2'], fontSize=11, spaceBefore=10, spaceAfter=5, textColor=rl_colors.HexColor('#003366'))
+_SAFETY_TITLE_STYLE = ParagraphStyle('SafetyTitle', parent=_PDF_STYLES['Heading1'], fontSize=14, alignment=1)
+_SAFETY_SECTION_STYLE = ParagraphStyle('SafetySection', parent=_PDF_STYLES['Heading2'], fontSize=11, spaceBefore=10, spaceAfter=5)
+_MANPOWER_TITLE_STYLE = ParagraphStyle('ManpowerTitle', parent=_PDF_STYLES['Heading1'], fontSize=18, alignment=1, textColor=rl_colors.HexColor('#FF6B00'))
+_MANPOWER_SUBTITLE_STYLE = ParagraphStyle('ManpowerSubtitle', parent=_PDF_STYLES['Normal'], fontSize=12, alignment=1)
+_MANPOWER_SECTION_STYLE = ParagraphStyle('ManpowerSection', parent=_PDF_STYLES['Heading2'], fontSize=12, spaceBefore=15, spaceAfter=8, textColor=rl_colors.HexColor('#003366'))
+_REPORT_FOOTER_SM_STYLE = ParagraphStyle('ReportFooterSm', fontSize=7, textColor=rl_colors.gray, alignment=1)
+_REPORT_FOOTER_STYLE = ParagraphStyle('ReportFooter', fontSize=8, textColor=rl_colors.gray, alignment=1)
+
+def _striped_table_style(base_cmds, n_rows, stripe=_STRIPE_GRAY):
+    """Build a TableStyle from precomputed commands plus per-row stripes."""
+    cmds = list(base_cmds)
+    cmds.extend(
+        ('BACKGROUND', (0, r), (-1, r), rl_colors.white if r % 2 else stripe)
+        for r in range(1, n_rows)
+    )
+    return TableStyle(cmds)
+
 def get_legal_subcontractor_name(trade: str, admin_id: str) -> str:
     """Get legal subcontractor name from trade mapping"""
     mapping = trade_mappings_collection.find_one({"trade": trade, "admin_id": admin_id})
@@ -2973,12 +3402,6 @@ def get_legal_subcontractor_name(trade: str, admin_id: str) -> str:
 
 def generate_jobsite_log_pdf(project_id: str, report_date: str, admin_id: str) -> bytes:
     """Generate NYC DOB Daily Jobsite Log PDF (Form 3301-02)"""
-    from reportlab.lib.pagesizes import letter
-    from reportlab.lib import colors
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    
     # Get project info
     project = projects_collection.find_one({"_id": ObjectId(project_id)})
     project_name = project["name"] if project else "Unknown"
@@ -3010,10 +3433,10 @@ def generate_jobsite_log_pdf(project_id: str, report_date: str, admin_id: str) -
     buffer = io.BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.3*inch, bottomMargin=0.3*inch, leftMargin=0.4*inch, rightMargin=0.4*inch)
     
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle('Title', parent=styles['Heading1'], fontSize=14, alignment=1, spaceAfter=5)
-    subtitle_style = ParagraphStyle('Subtitle', parent=styles['Normal'], fontSize=9, alignment=1, textColor=colors.gray)
-    section_style = ParagraphStyle('Section', parent=styles['Heading2'], fontSize=11, spaceBefore=10, spaceAfter=5, textColor=colors.HexColor('#003366'))
+    styles = _PDF_STYLES
+    title_style = _JOBSITE_TITLE_STYLE
+    subtitle_style = _JOBSITE_SUBTITLE_STYLE
+    section_style = _JOBSITE_SECTION_STYLE
     
     elements = []
     
@@ -3042,41 +3465,33 @@ def generate_jobsite_log_pdf(project_id: str, report_date: str, admin_id: str) -
     elements.append(Paragraph("3. Activity Details - Manpower Log", section_style))
     
     # Group by company
+    checkins = [{**_CHECKIN_ROW_DEFAULTS, **c} for c in checkins]
     companies = {}
     for c in checkins:
-        company = get_legal_subcontractor_name(c.get("worker_company", "Unknown"), admin_id)
+        company = get_legal_subcontractor_name(c["worker_company"], admin_id)
         if company not in companies:
             companies[company] = []
         companies[company].append(c)
-    
+
     activity_data = [["Time In", "Worker Name", "Trade", "Legal Subcontractor", "OSHA #"]]
     for company, workers in companies.items():
         for w in workers:
-            time_in = w.get("check_in_time")
+            time_in = w["check_in_time"]
             if isinstance(time_in, datetime):
                 time_in = time_in.strftime("%H:%M")
             activity_data.append([
                 time_in or "N/A",
-                w.get("worker_name", "N/A"),
-                w.get("worker_trade", "N/A"),
+                w["worker_name"],
+                w["worker_trade"],
                 company,
-                w.get("worker_osha_number", "N/A")
+                w["worker_osha_number"]
             ])
     
     if len(activity_data) == 1:
         activity_data.append(["", "No check-ins recorded", "", "", ""])
     
     activity_table = Table(activity_data, colWidths=[0.7*inch, 1.8*inch, 1.2*inch, 1.8*inch, 1.2*inch])
-    activity_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#003366')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.gray),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F5F5F5')]),
-    ]))
+    activity_table.setStyle(_striped_table_style(_JOBSITE_ACTIVITY_CMDS, len(activity_data)))
     elements.append(activity_table)
     
     # Summary
@@ -3086,19 +3501,13 @@ def generate_jobsite_log_pdf(project_id: str, report_date: str, admin_id: str) -
     # Footer
     elements.append(Spacer(1, 0.3*inch))
     elements.append(Paragraph(f"Generated by Blueview | {datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')}", 
-                             ParagraphStyle('Footer', fontSize=7, textColor=colors.gray, alignment=1)))
+                             _REPORT_FOOTER_SM_STYLE))
     
     doc.build(elements)
     return buffer.getvalue()
 
 def generate_safety_meeting_pdf(project_id: str, meeting_date: str) -> bytes:
     """Generate Pre-Shift Safety Meeting PDF"""
-    from reportlab.lib.pagesizes import letter
-    from reportlab.lib import colors
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    
     meeting = safety_meetings_collection.find_one({
         "project_id": project_id,
         "meeting_date": meeting_date
@@ -3111,9 +3520,9 @@ def generate_safety_meeting_pdf(project_id: str, meeting_date: str) -> bytes:
     buffer = io.BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.4*inch, bottomMargin=0.4*inch)
     
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle('Title', parent=styles['Heading1'], fontSize=14, alignment=1)
-    section_style = ParagraphStyle('Section', parent=styles['Heading2'], fontSize=11, spaceBefore=10, spaceAfter=5)
+    styles = _PDF_STYLES
+    title_style = _SAFETY_TITLE_STYLE
+    section_style = _SAFETY_SECTION_STYLE
     
     elements = []
     
@@ -3170,59 +3579,47 @@ def generate_safety_meeting_pdf(project_id: str, meeting_date: str) -> bytes:
             "date": meeting_date
         }))
         for i, c in enumerate(checkins, 1):
+            c = {**_CHECKIN_ROW_DEFAULTS, **c}
             attendance_data.append([
                 str(i),
-                c.get("worker_name", "N/A"),
-                c.get("worker_osha_number", "N/A"),
-                "[Signed]" if c.get("signature") else ""
+                c["worker_name"],
+                c["worker_osha_number"],
+                "[Signed]" if c["signature"] else ""
             ])
     
     if len(attendance_data) == 1:
         attendance_data.append(["", "No attendees", "", ""])
     
     attendance_table = Table(attendance_data, colWidths=[0.5*inch, 2.5*inch, 2*inch, 2*inch])
-    attendance_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#003366')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.gray),
-        ('ALIGN', (0, 0), (0, -1), 'CENTER'),
-    ]))
+    attendance_table.setStyle(_ATTENDANCE_TABLE_STYLE)
     elements.append(attendance_table)
     
     # Footer
     elements.append(Spacer(1, 0.3*inch))
     elements.append(Paragraph(f"Generated by Blueview | {datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')}", 
-                             ParagraphStyle('Footer', fontSize=7, textColor=colors.gray, alignment=1)))
+                             _REPORT_FOOTER_SM_STYLE))
     
     doc.build(elements)
     return buffer.getvalue()
 
 def generate_manpower_summary_pdf(project_id: str, report_date: str, admin_id: str) -> bytes:
     """Generate combined manpower summary PDF"""
-    from reportlab.lib.pagesizes import letter
-    from reportlab.lib import colors
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    
     project = projects_collection.find_one({"_id": ObjectId(project_id)})
     project_name = project["name"] if project else "Unknown"
     project_address = project.get("address", project.get("location", "")) if project else ""
     
-    checkins = list(checkins_collection.find({
+    checkins = [{**_CHECKIN_ROW_DEFAULTS, **c} for c in checkins_collection.find({
         "project_id": project_id,
         "date": report_date
-    }))
-    
+    })]
+
     buffer = io.BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.4*inch, bottomMargin=0.4*inch)
-    
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle('Title', parent=styles['Heading1'], fontSize=18, alignment=1, textColor=colors.HexColor('#FF6B00'))
-    subtitle_style = ParagraphStyle('Subtitle', parent=styles['Normal'], fontSize=12, alignment=1)
-    section_style = ParagraphStyle('Section', parent=styles['Heading2'], fontSize=12, spaceBefore=15, spaceAfter=8, textColor=colors.HexColor('#003366'))
+
+    styles = _PDF_STYLES
+    title_style = _MANPOWER_TITLE_STYLE
+    subtitle_style = _MANPOWER_SUBTITLE_STYLE
+    section_style = _MANPOWER_SECTION_STYLE
     
     elements = []
     
@@ -3240,12 +3637,12 @@ def generate_manpower_summary_pdf(project_id: str, report_date: str, admin_id: s
     ]
     info_table = Table(info_data, colWidths=[1.5*inch, 5.5*inch])
     info_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#003366')),
-        ('TEXTCOLOR', (0, 0), (0, -1), colors.white),
+        ('BACKGROUND', (0, 0), (0, -1), rl_colors.HexColor('#003366')),
+        ('TEXTCOLOR', (0, 0), (0, -1), rl_colors.white),
         ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
         ('FONTSIZE', (0, 0), (-1, -1), 10),
         ('PADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#CCCCCC')),
+        ('GRID', (0, 0), (-1, -1), 1, rl_colors.HexColor('#CCCCCC')),
     ]))
     elements.append(info_table)
     
@@ -3254,30 +3651,22 @@ def generate_manpower_summary_pdf(project_id: str, report_date: str, admin_id: s
     
     companies = {}
     for c in checkins:
-        company = get_legal_subcontractor_name(c.get("worker_company", "Unknown"), admin_id)
+        company = get_legal_subcontractor_name(c["worker_company"], admin_id)
         if company not in companies:
             companies[company] = {"count": 0, "workers": []}
         companies[company]["count"] += 1
         companies[company]["workers"].append(c)
-    
+
     summary_data = [["Legal Subcontractor Name", "Trade", "# Workers"]]
     for company, data in companies.items():
-        trades = set(w.get("worker_trade", "N/A") for w in data["workers"])
+        trades = set(w["worker_trade"] for w in data["workers"])
         summary_data.append([company, ", ".join(trades), str(data["count"])])
     
     if len(summary_data) == 1:
         summary_data.append(["No workers checked in", "", "0"])
     
     summary_table = Table(summary_data, colWidths=[3*inch, 2.5*inch, 1.5*inch])
-    summary_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#FF6B00')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.gray),
-        ('ALIGN', (-1, 0), (-1, -1), 'CENTER'),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#FFF5EB')]),
-    ]))
+    summary_table.setStyle(_striped_table_style(_MANPOWER_SUMMARY_CMDS, len(summary_data), stripe=_STRIPE_ORANGE))
     elements.append(summary_table)
     
     # Detailed Worker List
@@ -3285,37 +3674,29 @@ def generate_manpower_summary_pdf(project_id: str, report_date: str, admin_id: s
     
     worker_data = [["#", "Time In", "Worker Name", "Trade", "Company", "OSHA #"]]
     for i, c in enumerate(checkins, 1):
-        time_in = c.get("check_in_time")
+        time_in = c["check_in_time"]
         if isinstance(time_in, datetime):
             time_in = time_in.strftime("%H:%M")
         worker_data.append([
             str(i),
             time_in or "N/A",
-            c.get("worker_name", "N/A"),
-            c.get("worker_trade", "N/A"),
-            get_legal_subcontractor_name(c.get("worker_company", "N/A"), admin_id),
-            c.get("worker_osha_number", "N/A")
+            c["worker_name"],
+            c["worker_trade"],
+            get_legal_subcontractor_name(c["worker_company"], admin_id),
+            c["worker_osha_number"]
         ])
     
     if len(worker_data) == 1:
         worker_data.append(["", "", "No check-ins", "", "", ""])
     
     worker_table = Table(worker_data, colWidths=[0.4*inch, 0.7*inch, 1.5*inch, 1.2*inch, 1.5*inch, 1*inch])
-    worker_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#003366')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.gray),
-        ('ALIGN', (0, 0), (1, -1), 'CENTER'),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F5F5F5')]),
-    ]))
+    worker_table.setStyle(_striped_table_style(_MANPOWER_LEDGER_CMDS, len(worker_data)))
     elements.append(worker_table)
     
     # Footer
     elements.append(Spacer(1, 0.4*inch))
     elements.append(Paragraph(f"Report Generated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')} | Blueview Construction Management", 
-                             ParagraphStyle('Footer', fontSize=8, textColor=colors.gray, alignment=1)))
+                             _REPORT_FOOTER_STYLE))
     
     doc.build(elements)
     return buffer.getvalue()
@@ -3333,45 +3714,89 @@ async def generate_daily_report(
     if not report_date:
         report_date = date.today().isoformat()
     
-    # Get report settings
-    settings = report_settings_collection.find_one({"project_id": project_id})
-    
-    # Get project
-    project = projects_collection.find_one({"_id": ObjectId(project_id)})
+    # Run the three setup queries concurrently on the async driver
+    settings, project, checkins_count = await asyncio.gather(
+        async_db.report_settings.find_one({"project_id": project_id}),
+        async_db.projects.find_one({"_id": ObjectId(project_id)}),
+        async_db.checkins.count_documents({
+            "project_id": project_id,
+            "date": report_date
+        })
+    )
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
-    
-    # Get check-ins count
-    checkins_count = checkins_collection.count_documents({
-        "project_id": project_id,
-        "date": report_date
-    })
-    
+
+    # Report generation is deterministic in (project, date, check-ins,
+    # safety meeting); if none of those moved since the last run, reuse the
+    # stored report instead of re-rendering three PDFs
+    latest_checkin, safety_meeting = await asyncio.gather(
+        async_db.checkins.find_one(
+            {"project_id": project_id, "date": report_date},
+            projection={"check_in_time": 1},
+            sort=[("check_in_time", -1)]
+        ),
+        async_db.safety_meetings.find_one(
+            {"project_id": project_id, "meeting_date": report_date},
+            projection={"created_at": 1, "attendees": 1},
+            sort=[("created_at", -1)]
+        )
+    )
+    last_checkin_at = str(latest_checkin["check_in_time"]) if latest_checkin else ""
+    safety_meeting_rev = (
+        f"{safety_meeting['created_at']}|{len(safety_meeting.get('attendees', []))}"
+        if safety_meeting else ""
+    )
+    cache_key = hashlib.blake2b(
+        f"{project_id}|{report_date}|{checkins_count}|{last_checkin_at}|{safety_meeting_rev}".encode(),
+        digest_size=16
+    ).hexdigest()
+
+    email_required = bool(settings and settings.get("email_recipients") and RESEND_API_KEY)
+    cached = await async_db.generated_reports.find_one(
+        {"cache_key": cache_key}, {"reports": 0}
+    )
+    # Only complete runs are cacheable: records written before this field
+    # existed, or with failed renders, miss and get regenerated
+    if (cached and len(cached.get("reports_generated", [])) == 3
+            and (not email_required or cached.get("email_sent"))):
+        return {
+            "report_id": str(cached["_id"]),
+            "project_name": project["name"],
+            "report_date": report_date,
+            "workers_count": checkins_count,
+            "reports_generated": cached["reports_generated"],
+            "email_sent": cached.get("email_sent", False),
+            "email_recipients": cached.get("email_recipients", []),
+            "email_error": None,
+            "cached": True
+        }
+
     # Generate PDFs
     reports = {}
-    
-    # Generate Jobsite Log
-    try:
-        jobsite_pdf = generate_jobsite_log_pdf(project_id, report_date, current_user["id"])
-        reports["jobsite_log"] = base64.b64encode(jobsite_pdf).decode()
-    except Exception as e:
-        reports["jobsite_log_error"] = str(e)
-    
-    # Generate Safety Meeting PDF
-    try:
-        safety_pdf = generate_safety_meeting_pdf(project_id, report_date)
-        reports["safety_meeting"] = base64.b64encode(safety_pdf).decode()
-    except Exception as e:
-        reports["safety_meeting_error"] = str(e)
-    
-    # Generate Manpower Summary
-    try:
-        manpower_pdf = generate_manpower_summary_pdf(project_id, report_date, current_user["id"])
-        reports["manpower_summary"] = base64.b64encode(manpower_pdf).decode()
-    except Exception as e:
-        reports["manpower_summary_error"] = str(e)
-    
-    # Store report record
+
+    # Generate the three PDFs concurrently off the event loop
+    pdf_jobs = [
+        ("jobsite_log", generate_jobsite_log_pdf, (project_id, report_date, current_user["id"])),
+        ("safety_meeting", generate_safety_meeting_pdf, (project_id, report_date)),
+        ("manpower_summary", generate_manpower_summary_pdf, (project_id, report_date, current_user["id"])),
+    ]
+    loop = asyncio.get_running_loop()
+    rendered = await asyncio.gather(
+        *(loop.run_in_executor(PDF_POOL, fn, *args) for _, fn, args in pdf_jobs),
+        return_exceptions=True
+    )
+    for (name, _, _), pdf_bytes in zip(pdf_jobs, rendered):
+        if isinstance(pdf_bytes, Exception):
+            reports[f"{name}_error"] = str(pdf_bytes)
+        else:
+            # Encode off the event loop; memoryview avoids an intermediate copy
+            enc = await asyncio.to_thread(pybase64.b64encode, memoryview(pdf_bytes))
+            reports[name] = enc.decode("ascii")
+    
+    # Store report record; a run with failed renders keeps its *_error
+    # entries for audit but gets no cache_key, so it can never satisfy a
+    # cache hit and the next call re-renders
+    reports_generated = [k for k in reports if not k.endswith("_error")]
     report_record = {
         "project_id": project_id,
         "project_name": project["name"],
@@ -3380,11 +3805,13 @@ async def generate_daily_report(
         "generated_by": current_user["id"],
         "workers_count": checkins_count,
         "reports": reports,
+        "reports_generated": reports_generated,
+        "cache_key": cache_key if len(reports_generated) == 3 else None,
         "email_sent": False,
         "email_recipients": []
     }
     
-    result = generated_reports_collection.insert_one(report_record)
+    result = await async_db.generated_reports.insert_one(report_record)
     report_id = str(result.inserted_id)
     
     # Send email if recipients configured
@@ -3394,45 +3821,53 @@ async def generate_daily_report(
         try:
             recipients = settings["email_recipients"]
             
-            # Create email with attachment
+            report_files = [
+                ("manpower_summary", f"ManpowerReport_{report_date}.pdf"),
+                ("jobsite_log", f"JobsiteLog_{report_date}.pdf"),
+                ("safety_meeting", f"SafetyMeeting_{report_date}.pdf"),
+            ]
+
             email_body = f"""
             <h2>Daily Manpower Report - {project["name"]}</h2>
             <p><strong>Date:</strong> {report_date}</p>
             <p><strong>Total Workers:</strong> {checkins_count}</p>
-            <p>Please find the attached daily reports.</p>
-            <hr>
-            <p><em>Generated by Blueview Construction Management</em></p>
             """
-            
-            # Prepare attachments
-            attachments = []
-            if "manpower_summary" in reports:
-                attachments.append({
-                    "filename": f"ManpowerReport_{report_date}.pdf",
-                    "content": reports["manpower_summary"]
-                })
-            if "jobsite_log" in reports:
-                attachments.append({
-                    "filename": f"JobsiteLog_{report_date}.pdf",
-                    "content": reports["jobsite_log"]
-                })
-            if "safety_meeting" in reports:
-                attachments.append({
-                    "filename": f"SafetyMeeting_{report_date}.pdf",
-                    "content": reports["safety_meeting"]
-                })
-            
-            resend.api_key = RESEND_API_KEY
-            email_result = resend.Emails.send({
+
+            email_params = {
                 "from": "Blueview Reports <reports@resend.dev>",
                 "to": recipients,
                 "subject": f"Daily Manpower Report - {project['name']} - {report_date}",
-                "html": email_body,
-                "attachments": attachments
-            })
+            }
+
+            if REPORT_EMAIL_ATTACHMENTS == "links":
+                # Reference the stored reports instead of re-shipping the PDFs
+                # as base64 inside the email request body. Recipients have no
+                # bearer token, so each link carries its own signed grant
+                base_url = os.getenv("APP_URL", "https://blueview.app")
+                links = "".join(
+                    f'<p><a href="{base_url}/api/reports/email-download'
+                    f'?token={_report_download_token(report_id, key)}">{filename}</a></p>'
+                    for key, filename in report_files if key in reports
+                )
+                email_body += f"<p>Download the daily reports:</p>{links}"
+            else:
+                email_body += "<p>Please find the attached daily reports.</p>"
+                email_params["attachments"] = [
+                    {"filename": filename, "content": reports[key]}
+                    for key, filename in report_files if key in reports
+                ]
+
+            email_body += """
+            <hr>
+            <p><em>Generated by Blueview Construction Management</em></p>
+            """
+            email_params["html"] = email_body
+
+            resend.api_key = RESEND_API_KEY
+            email_result = resend.Emails.send(email_params)
             
             email_sent = True
-            generated_reports_collection.update_one(
+            await async_db.generated_reports.update_one(
                 {"_id": ObjectId(report_id)},
                 {"$set": {
                     "email_sent": True,
@@ -3449,18 +3884,29 @@ async def generate_daily_report(
         "project_name": project["name"],
         "report_date": report_date,
         "workers_count": checkins_count,
-        "reports_generated": list(k for k in reports.keys() if not k.endswith("_error")),
+        "reports_generated": reports_generated,
         "email_sent": email_sent,
         "email_recipients": settings.get("email_recipients", []) if settings else [],
         "email_error": email_error
     }
 
 @app.get("/api/projects/{project_id}/reports")
-def get_project_reports(project_id: str, current_user: dict = Depends(require_admin)):
-    """Get all generated reports for a project (for audit/download)"""
-    reports = list(generated_reports_collection.find({"project_id": project_id}).sort("report_date", -1).limit(30))
-    
-    # Remove large PDF data for listing
+async def get_project_reports(project_id: str, before: Optional[str] = None, current_user: dict = Depends(require_admin)):
+    """Get generated reports for a project (for audit/download)
+
+    Keyset-paginated: pass ?before=<report_date> (the oldest date from the
+    previous page) to fetch the next 30 - avoids O(offset) skip() scans.
+    """
+    query = {"project_id": project_id}
+    if before:
+        query["report_date"] = {"$lt": before}
+    # Exclude the base64 PDF blobs server-side - the listing never shows them
+    # and fetching them costs ~1 MB of wire + BSON parse per report
+    reports = await (
+        async_db.generated_reports.find(query, {"reports": 0})
+        .sort("report_date", -1).limit(30)
+    ).to_list(length=None)
+
     result = []
     for r in reports:
         result.append({
@@ -3476,9 +3922,9 @@ def get_project_reports(project_id: str, current_user: dict = Depends(require_ad
     return result
 
 @app.get("/api/reports/{report_id}/download")
-def download_report(report_id: str, report_type: str = "manpower_summary", current_user: dict = Depends(get_current_user)):
+async def download_report(report_id: PyObjectId, report_type: str = "manpower_summary", current_user: dict = Depends(get_current_user)):
     """Download a specific report PDF"""
-    report = generated_reports_collection.find_one({"_id": ObjectId(report_id)})
+    report = await async_db.generated_reports.find_one({"_id": ObjectId(report_id)})
     if not report:
         raise HTTPException(status_code=404, detail="Report not found")
     
@@ -3492,19 +3938,58 @@ def download_report(report_id: str, report_type: str = "manpower_summary", curre
         "report_date": report["report_date"]
     }
 
+# Emailed report links must work without a bearer token, so each one embeds
+# a signed grant scoped to a single report/type with its own expiry
+REPORT_LINK_TTL_DAYS = 7
+
+def _report_download_token(report_id: str, report_type: str) -> str:
+    payload = {
+        "scope": "report_download",
+        "report_id": report_id,
+        "report_type": report_type,
+        "exp": datetime.utcnow() + timedelta(days=REPORT_LINK_TTL_DAYS)
+    }
+    return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
+
+@app.get("/api/reports/email-download")
+async def download_report_by_token(token: str):
+    """Serve a report PDF to an email recipient via its signed link"""
+    payload = decode_token(token)
+    if payload.get("scope") != "report_download":
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    report_type = payload["report_type"]
+    report = await async_db.generated_reports.find_one(
+        {"_id": ObjectId(payload["report_id"])},
+        {f"reports.{report_type}": 1, "report_date": 1}
+    )
+    if not report:
+        raise HTTPException(status_code=404, detail="Report not found")
+
+    pdf_data = report.get("reports", {}).get(report_type)
+    if not pdf_data:
+        raise HTTPException(status_code=404, detail=f"Report type '{report_type}' not found")
+
+    filename = f"{report_type}_{report['report_date']}.pdf"
+    return Response(
+        content=pybase64.b64decode(pdf_data, validate=False),
+        media_type="application/pdf",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
 @app.get("/api/checkins/{project_id}/{checkin_date}")
-def get_project_checkins(project_id: str, checkin_date: str, current_user: dict = Depends(get_current_user)):
+async def get_project_checkins(project_id: str, checkin_date: str, current_user: dict = Depends(get_current_user)):
     """Get all check-ins for a project on a specific date"""
-    checkins = list(checkins_collection.find({
+    checkins = await async_db.checkins.find({
         "project_id": project_id,
         "date": checkin_date
-    }))
+    }).to_list(length=None)
     return serialize_docs(checkins)
 
 @app.post("/api/setup/init-admin")
-def init_admin():
+async def init_admin():
     """Initialize the first admin account"""
-    existing_admin = users_collection.find_one({"role": "admin"})
+    existing_admin = await async_db.users.find_one({"role": "admin"})
     if existing_admin:
         # Return existing admin info (without password)
         return {
@@ -3515,13 +4000,13 @@ def init_admin():
     
     admin_dict = {
         "email": "admin@blueview.com",
-        "password": hash_password("BlueviewAdmin123"),
+        "password": await hash_password_async("BlueviewAdmin123"),
         "name": "Site Admin",
         "role": "admin",
         "assigned_projects": [],
         "created_at": datetime.utcnow(),
     }
-    result = users_collection.insert_one(admin_dict)
+    result = await async_db.users.insert_one(admin_dict)
     
     return {
         "message": "Admin created successfully",
@@ -3533,13 +4018,13 @@ def init_admin():
     }
 
 @app.get("/api/setup/status")
-def get_setup_status():
+async def get_setup_status():
     """Check setup status - for testing purposes"""
-    admin_exists = users_collection.find_one({"role": "admin"}) is not None
-    project_count = projects_collection.count_documents({})
-    worker_count = workers_collection.count_documents({})
-    subcontractor_count = users_collection.count_documents({"role": "subcontractor"})
-    material_request_count = material_requests_collection.count_documents({})
+    admin_exists = await async_db.users.find_one({"role": "admin"}) is not None
+    project_count = await async_db.projects.count_documents({})
+    worker_count = await async_db.workers.count_documents({})
+    subcontractor_count = await async_db.users.count_documents({"role": "subcontractor"})
+    material_request_count = await async_db.material_requests.count_documents({})
     
     return {
         "admin_exists": admin_exists,